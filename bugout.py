@@ -5,33 +5,66 @@ bugout.py - Automated bug analysis and patch preparation tool
 Usage: python bugout.py <repo> <bug_number>
 
 This tool:
-1. Fetches all comments for a GitHub issue using gh CLI
+1. Fetches all comments for a GitHub issue from the GitHub GraphQL API
 2. Extracts features from comments using parser.py
 3. Analyzes bug nature and generates PRD
 4. Attempts to fix the bug
 5. Finds competent reviewers using Yutori API
 6. Prepares a patch folder with all necessary files
+
+The gh CLI is optional: it supplies the GitHub token when GH_TOKEN and
+GITHUB_TOKEN are unset, and makes the first clone of a repository into
+the local repo cache.
 """
 
 import os
+import re
 import sys
-import json
 import subprocess
 import shutil
 import tempfile
+import threading
 import uuid
+import importlib.util
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
-from typing import Optional, List, Dict
+from typing import Optional, List, Dict, Tuple, Iterable, Iterator
 from datetime import datetime
-from collections import Counter
+from functools import lru_cache
+from itertools import zip_longest
+from collections import Counter, defaultdict
+
+import requests
+from urllib3.util.retry import Retry
+from dotenv import load_dotenv
 
 from review_checker import check_reviewers_bulk, get_best_reviewer
+from jsonio import loads, dumps, dump_file
+from cache import cache_key, cache_get, cache_put
+
+# Load environment variables before parser.py reads FASTINO_KEY into its
+# session headers and the settings below are read
+load_dotenv()
+
+# parser.py shares its name with a stdlib module on Python < 3.10,
+# so load it by path rather than with a plain import
+_parser_spec = importlib.util.spec_from_file_location("bugout_parser", Path(__file__).parent / "parser.py")
+feature_parser = importlib.util.module_from_spec(_parser_spec)
+_parser_spec.loader.exec_module(feature_parser)
 
-# Load environment variables
 OPENAI_HOST = os.environ.get("OPENAI_HOST")
 OPENAI_MODEL = os.environ.get("OPENAI_MODEL")
 OPENAI_API_KEY = os.environ.get("OPENAI_API_KEY")
 
+# Runs network-bound steps that don't feed the next step directly
+background = ThreadPoolExecutor(max_workers=4)
+
+# One keep-alive session for every LLM call, so only the first pays the handshake
+llm_session = requests.Session()
+llm_session.headers["Content-Type"] = "application/json"
+if OPENAI_API_KEY:
+    llm_session.headers["Authorization"] = f"Bearer {OPENAI_API_KEY}"
+
 # ANSI Colors & Styles
 class Colors:
     RESET = '\033[0m'
@@ -190,16 +223,10 @@ def print_tree_item(text: str, is_last: bool = False, indent: int = 0):
     print(f"{prefix}{c(connector + text, Colors.BRIGHT_WHITE)}")
 
 def call_llm(prompt: str, system_prompt: str = "", max_tokens: int = 4000) -> str:
-    """Call the LLM API with the given prompt."""
-    import requests
-    
-    headers = {
-        "Content-Type": "application/json"
-    }
-    
-    if OPENAI_API_KEY:
-        headers["Authorization"] = f"Bearer {OPENAI_API_KEY}"
-    
+    """
+    Call the LLM API with the given prompt.
+    Responses are cached on disk by request, so repeat runs skip the round trip.
+    """
     messages = []
     if system_prompt:
         messages.append({"role": "system", "content": system_prompt})
@@ -212,38 +239,69 @@ def call_llm(prompt: str, system_prompt: str = "", max_tokens: int = 4000) -> st
         "max_tokens": max_tokens
     }
     
+    key = cache_key(OPENAI_HOST, payload)
+    content = cache_get("llm", key)
+    if content is not None:
+        return content
+    
     try:
-        response = requests.post(
+        response = llm_session.post(
             f"{OPENAI_HOST}/v1/chat/completions",
-            headers=headers,
             json=payload,
             timeout=120
         )
         response.raise_for_status()
         result = response.json()
-        return result["choices"][0]["message"]["content"]
+        content = result["choices"][0]["message"]["content"]
     except Exception as e:
         raise Exception(f"LLM API error: {e}")
+    
+    cache_put("llm", key, content)
+    return content
+
+
+# Reports the LLM summary looks at
+SUMMARY_REPORTS = 20
+
+# Total characters of report text and of file content put into a prompt
+REPORT_CONTEXT_CHARS = 20 * 500
+FILE_CONTEXT_CHARS = 10 * 3000
+
 
+def clip(text: str, limit: int) -> str:
+    """Cut text to at most limit characters, ending on a line break when one is near."""
+    if len(text) <= limit:
+        return text
+    cut = text.rfind("\n", 0, limit)
+    return text[:cut] if cut > limit // 2 else text[:limit]
 
-def summarize_bug_nature(reports: list, issue_title: str = "") -> str:
+
+def share_budget(texts: List[str], budget: int) -> List[str]:
     """
-    Use OpenAI API to summarize the nature of the bug based on all reports.
-    Returns a comprehensive summary of the bug's nature, impact, and root causes.
+    Clip texts so together they fit in budget characters.
+    Short texts keep all they need and the rest is split evenly among the
+    longer ones, rather than cutting every text at the same fixed length.
     """
-    if not OPENAI_HOST or not OPENAI_MODEL:
-        print(f"  {warning('OPENAI_HOST or OPENAI_MODEL not set, skipping LLM summary')}")
-        return "No LLM summary available (missing OPENAI_HOST or OPENAI_MODEL)"
-    
+    limits = [0] * len(texts)
+    remaining = budget
+    by_length = sorted(range(len(texts)), key=lambda i: len(texts[i]))
+    for n, i in enumerate(by_length):
+        limits[i] = min(len(texts[i]), remaining // (len(texts) - n))
+        remaining -= limits[i]
+    return [clip(text, limit) for text, limit in zip(texts, limits)]
+
+
+SUMMARY_SYSTEM_PROMPT = "You are a technical analyst specializing in bug report analysis. Provide clear, actionable summaries of software issues."
+
+
+def bug_summary_prompt(reports: list, issue_title: str = "") -> str:
+    """Build the LLM prompt summarizing the reports. Empty if they carry no text."""
     # Prepare context from reports
-    contexts = []
-    for r in reports[:20]:  # Limit to first 20 reports to avoid token limits
-        text = r.get("text", "")
-        if text:
-            contexts.append(text[:500])  # Truncate each to avoid overflow
+    texts = [r.get("text", "") for r in reports[:SUMMARY_REPORTS]]  # Limit to first reports to avoid token limits
+    contexts = share_budget([text for text in texts if text], REPORT_CONTEXT_CHARS)  # Truncate to avoid overflow
     
     if not contexts:
-        return "No text content available for summarization"
+        return ""
     
     # Build prompt
     prompt = f"""Analyze the following bug reports and provide a comprehensive summary of:
@@ -261,13 +319,31 @@ Bug Reports:
     for i, ctx in enumerate(contexts, 1):
         prompt += f"\n--- Report {i} ---\n{ctx}\n"
     
+    return prompt
+
+
+def summarize_bug_nature(reports: list, issue_title: str = "", pending: Optional[Future] = None) -> str:
+    """
+    Use OpenAI API to summarize the nature of the bug based on all reports.
+    Returns a comprehensive summary of the bug's nature, impact, and root causes.
+    pending is an LLM call already started by start_bug_summary; it is
+    reported here, where it's collected, rather than while it runs.
+    """
+    if not OPENAI_HOST or not OPENAI_MODEL:
+        print(f"  {warning('OPENAI_HOST or OPENAI_MODEL not set, skipping LLM summary')}")
+        return "No LLM summary available (missing OPENAI_HOST or OPENAI_MODEL)"
+    
+    if pending is None:
+        prompt = bug_summary_prompt(reports, issue_title)
+        if not prompt:
+            return "No text content available for summarization"
+    
     try:
         print(f"  {c(f'{Symbols.LIGHTBULB} Querying LLM for bug analysis...', Colors.BRIGHT_YELLOW)}")
-        summary = call_llm(
-            prompt,
-            system_prompt="You are a technical analyst specializing in bug report analysis. Provide clear, actionable summaries of software issues.",
-            max_tokens=1500
-        )
+        if pending is not None:
+            summary = pending.result()
+        else:
+            summary = call_llm(prompt, system_prompt=SUMMARY_SYSTEM_PROMPT, max_tokens=1500)
         print(f"  {success('LLM analysis complete')}")
         return summary
     except Exception as e:
@@ -275,6 +351,24 @@ Bug Reports:
         return f"Error generating summary: {str(e)}"
 
 
+def start_bug_summary(rows: List[Dict], issue_title: str = "") -> Optional[Future]:
+    """
+    Kick off the LLM bug summary in the background.
+    The summary only reads comment text, so it can start before features exist.
+    Nothing is printed until summarize_bug_nature collects it. Returns None
+    if there is nothing to send, leaving summarize_bug_nature to say why.
+    """
+    prompt = bug_summary_prompt(rows, issue_title)
+    if not (OPENAI_HOST and OPENAI_MODEL and prompt):
+        return None
+    return background.submit(call_llm, prompt, system_prompt=SUMMARY_SYSTEM_PROMPT, max_tokens=1500)
+
+
+def decode(output: Optional[bytes]) -> str:
+    """Decode captured subprocess output, which is None when not captured."""
+    return output.decode("utf-8", errors="replace") if output else ""
+
+
 def run_command(cmd: List[str], cwd: Optional[str] = None, capture_output: bool = True) -> tuple:
     """Run a shell command and return (stdout, stderr, returncode)."""
     try:
@@ -282,70 +376,184 @@ def run_command(cmd: List[str], cwd: Optional[str] = None, capture_output: bool
             cmd,
             cwd=cwd,
             capture_output=capture_output,
-            text=True,
             shell=False
         )
-        return result.stdout, result.stderr, result.returncode
+        # Decode as UTF-8 ourselves rather than via the locale, and never fail on odd bytes
+        return decode(result.stdout), decode(result.stderr), result.returncode
     except Exception as e:
         return "", str(e), 1
 
 
-def fetch_issue_comments(repo: str, issue_number: str, output_dir: Path) -> Path:
+GITHUB_GRAPHQL_URL = "https://api.github.com/graphql"
+
+# GitHub API calls go straight over HTTPS on one keep-alive session, retrying
+# on rate limiting and transient server errors
+github_session = requests.Session()
+github_session.mount("https://", requests.adapters.HTTPAdapter(
+    max_retries=Retry(total=3, backoff_factor=2, status_forcelist=(429, 502, 503, 504), allowed_methods=None)
+))
+
+
+@lru_cache(maxsize=None)
+def github_token() -> str:
+    """Return a GitHub token from GH_TOKEN/GITHUB_TOKEN, or from the gh CLI login."""
+    token = os.environ.get("GH_TOKEN") or os.environ.get("GITHUB_TOKEN")
+    if token:
+        return token
+    stdout, stderr, rc = run_command(["gh", "auth", "token"])
+    if rc != 0:
+        raise Exception(f"No GitHub token available: {stderr.strip()}")
+    return stdout.strip()
+
+
+def github_graphql(query: str, variables: Dict) -> Dict:
+    """Run a GraphQL query against the GitHub API and return its data."""
+    response = github_session.post(
+        GITHUB_GRAPHQL_URL,
+        json={"query": query, "variables": variables},
+        headers={"Authorization": f"bearer {github_token()}"},
+        timeout=60
+    )
+    response.raise_for_status()
+    body = response.json()
+    if body.get("errors"):
+        raise Exception("; ".join(e.get("message", "") for e in body["errors"]))
+    return body["data"]
+
+
+# Issue plus one page of comments; re-run with $cursor while more pages remain
+ISSUE_FIELDS = """
+fragment IssueFields on Issue {
+  number title state body createdAt
+  author { login }
+  labels(first: 100) { nodes { name } }
+  comments(first: 100, after: $cursor) {
+    pageInfo { hasNextPage endCursor }
+    nodes { author { login } createdAt body }
+  }
+}
+"""
+
+ISSUE_QUERY = """
+query($owner: String!, $repo: String!, $number: Int!, $cursor: String) {
+  repository(owner: $owner, name: $repo) {
+    issue(number: $number) { ...IssueFields }
+  }
+}
+""" + ISSUE_FIELDS
+
+# Issues fetched per aliased GraphQL request in batch mode
+ISSUES_PER_QUERY = 20
+
+
+def prefetch_issues(issues: List[Tuple[str, str]]) -> Dict[Tuple[str, str], Dict]:
+    """
+    Fetch the issue and first comment page for many (repo, number) pairs,
+    ISSUES_PER_QUERY at a time using aliased fields in one GraphQL query.
+    Best effort: a chunk that fails is left for fetch_issue_comments to fetch
+    (and report) on its own.
+    """
+    prefetched = {}
+    for start in range(0, len(issues), ISSUES_PER_QUERY):
+        chunk = issues[start:start + ISSUES_PER_QUERY]
+        params, fields, variables = ["$cursor: String"], [], {"cursor": None}
+        for i, (repo, number) in enumerate(chunk):
+            try:
+                owner, name = repo.split("/", 1)
+                variables.update({f"o{i}": owner, f"r{i}": name, f"n{i}": int(number)})
+            except ValueError:
+                # Left out of the query; fetch_issue_comments reports it
+                continue
+            params.append(f"$o{i}: String!, $r{i}: String!, $n{i}: Int!")
+            fields.append(f"i{i}: repository(owner: $o{i}, name: $r{i}) {{ issue(number: $n{i}) {{ ...IssueFields }} }}")
+        if not fields:
+            continue
+        query = f"query({', '.join(params)}) {{\n  " + "\n  ".join(fields) + "\n}\n" + ISSUE_FIELDS
+        try:
+            data = github_graphql(query, variables)
+        except Exception as e:
+            print(f"  {warning(f'Batch fetch failed, fetching issues one by one: {e}')}")
+            continue
+        for i, issue in enumerate(chunk):
+            issue_data = (data.get(f"i{i}") or {}).get("issue")
+            if issue_data:
+                prefetched[issue] = issue_data
+    return prefetched
+
+
+def fetch_issue_comments(repo: str, issue_number: str, output_dir: Path, prefetched: Optional[Dict] = None) -> Tuple[Path, List[Dict]]:
     """
-    Step 1: Fetch all comments for a GitHub issue using gh CLI.
-    Saves the output as JSON.
+    Step 1: Fetch all comments for a GitHub issue from the GraphQL API.
+    Uses one request per 100 comments. Saves the rows as JSON lines.
+    prefetched is the issue with its first comment page from prefetch_issues, if any.
+    Returns (output_file, rows) so later steps can reuse the rows without re-reading the file.
     """
     print(f"\n{section(1, f'{Symbols.MAGNIFYING_GLASS} Fetching Issue Comments')} {c(f'for {repo}#{issue_number}', Colors.DIM)}")
     
-    output_file = output_dir / "issue_comments.json"
+    output_file = output_dir / "issue_comments.jsonl"
     
-    # Use gh CLI to fetch issue with comments
-    cmd = [
-        "gh", "issue", "view", issue_number,
-        "--repo", repo,
-        "--json", "number,title,state,labels,body,author,createdAt,comments"
-    ]
-    
-    stdout, stderr, rc = run_command(cmd)
+    owner, name = repo.split("/", 1)
+    issue_data = None
+    comments = []
+    cursor = None
     
-    if rc != 0:
-        print(f"  {error(f'Failed to fetch issue: {stderr}')}")
-        raise Exception(f"Failed to fetch issue: {stderr}")
-    
-    # Parse the JSON and reformat for our parser
-    issue_data = json.loads(stdout)
+    # Fetch the issue and its comments over GraphQL
+    while True:
+        variables = {"owner": owner, "repo": name, "number": int(issue_number), "cursor": cursor}
+        
+        if prefetched:
+            issue_data, prefetched = prefetched, None
+        else:
+            try:
+                data = github_graphql(ISSUE_QUERY, variables)
+            except Exception as e:
+                print(f"  {error(f'Failed to fetch issue: {e}')}")
+                raise Exception(f"Failed to fetch issue: {e}")
+            
+            issue_data = (data.get("repository") or {}).get("issue")
+            if not issue_data:
+                print(f"  {error(f'Issue {repo}#{issue_number} not found')}")
+                raise Exception(f"Issue {repo}#{issue_number} not found")
+        
+        page = issue_data["comments"]
+        comments.extend(page["nodes"])
+        if not page["pageInfo"]["hasNextPage"]:
+            break
+        cursor = page["pageInfo"]["endCursor"]
+    
+    # Fields shared by every row
+    issue_fields = {
+        "issue_number": issue_data["number"],
+        "issue_title": issue_data["title"],
+        "state": issue_data["state"],
+        "labels": ";".join(l["name"] for l in issue_data["labels"]["nodes"]),
+    }
     
-    # Flatten into rows like comment1.sh does
+    # Flatten into rows like comment1.sh does. Deleted accounts have no
+    # author, which GitHub shows as "ghost".
     rows = []
     
     # Add issue body as first row
     rows.append({
-        "issue_number": issue_data["number"],
-        "issue_title": issue_data["title"],
-        "state": issue_data["state"],
-        "labels": ";".join([l["name"] for l in issue_data.get("labels", [])]),
-        "author": issue_data["author"]["login"],
+        **issue_fields,
+        "author": (issue_data["author"] or {}).get("login", "ghost"),
         "created_at": issue_data["createdAt"],
         "type": "issue",
         "text": issue_data["body"]
     })
     
     # Add each comment
-    for comment in issue_data.get("comments", []):
-        rows.append({
-            "issue_number": issue_data["number"],
-            "issue_title": issue_data["title"],
-            "state": issue_data["state"],
-            "labels": ";".join([l["name"] for l in issue_data.get("labels", [])]),
-            "author": comment["author"]["login"],
-            "created_at": comment["createdAt"],
-            "type": "comment",
-            "text": comment["body"]
-        })
-    
-    # Save to JSON file
-    with open(output_file, "w") as f:
-        json.dump(rows, f, indent=2)
+    rows.extend({
+        **issue_fields,
+        "author": (comment["author"] or {}).get("login", "ghost"),
+        "created_at": comment["createdAt"],
+        "type": "comment",
+        "text": comment["body"]
+    } for comment in comments)
+    
+    # Save one row per line, which parser.py also reads directly
+    with open(output_file, "wb") as f:
+        f.writelines(dumps(row) + b"\n" for row in rows)
     
     # Print tree structure
     print(f"  {success(f'Saved {c(str(len(rows)), Colors.BRIGHT_YELLOW)} entries')}")
@@ -353,33 +561,31 @@ def fetch_issue_comments(repo: str, issue_number: str, output_dir: Path) -> Path
     if len(rows) > 1:
         print_tree_item(f"Comments: {c(str(len(rows)-1), Colors.BRIGHT_YELLOW)}", is_last=True)
     
-    return output_file
+    return output_file, rows
 
 
-def extract_features(comments_file: Path, output_dir: Path) -> Path:
+def extract_features(rows: List[Dict], output_dir: Path) -> Path:
     """
     Step 2: Use parser.py to extract features from comments.
+    Runs in-process rather than as a subprocess.
     Requires FASTINO_KEY environment variable.
     """
     print(f"\n{section(2, f'{Symbols.CHART} Extracting Features')}")
     
     output_file = output_dir / "bugs_with_features.jsonl"
     
-    # Run parser.py
-    cmd = ["python3", "parser.py", str(comments_file)]
-    
-    stdout, stderr, rc = run_command(cmd)
-    
-    if rc != 0:
-        print(f"  {error(f'Failed to extract features: {stderr}')}")
-        raise Exception(f"Failed to extract features: {stderr}")
-    
-    # Save output
-    with open(output_file, "w") as f:
-        f.write(stdout)
+    line_count = 0
+    try:
+        # Write each row as parser.py yields it. parser.py merges features into
+        # the rows it is given, so hand it copies.
+        with open(output_file, "wb") as f:
+            for row in feature_parser.extract(dict(row) for row in rows):
+                f.write(dumps(row) + b"\n")
+                line_count += 1
+    except Exception as e:
+        print(f"  {error(f'Failed to extract features: {e}')}")
+        raise Exception(f"Failed to extract features: {e}")
     
-    # Count lines
-    line_count = len(stdout.strip().split("\n")) if stdout.strip() else 0
     print(f"  {success(f'Extracted features for {c(str(line_count), Colors.BRIGHT_YELLOW)} entries')}")
     print_tree_item(f"Output: {c(str(output_file), Colors.DIM)}", is_last=True)
     
@@ -388,66 +594,79 @@ def extract_features(comments_file: Path, output_dir: Path) -> Path:
 
 # Core analysis logic from mcp.py
 
-def compute_frequency(values: list) -> list:
-    """Return [[value, count], ...] sorted by count descending."""
-    counter = Counter(str(v) for v in values)
-    return [[v, c] for v, c in counter.most_common()]
+def compute_frequency(counter: Counter) -> list:
+    """Return [(value, count), ...] sorted by count descending."""
+    return counter.most_common()
 
 
-CATEGORICAL_FIELDS = [
+CATEGORICAL_FIELDS = (
     "software_version",
     "platform",
     "bug_behaviour",
     "crash",
     "user_frustration",
-]
+)
 
-TEXT_FIELDS = [
+TEXT_FIELDS = (
     "technical_description",
     "input_data",
     "expected_behaviour",
-]
+)
 
 
-def analyze_issue(issue_id: str, reports: list) -> dict:
+def analyze_issue(issue_id: str, reports: Iterable[dict]) -> dict:
     """
     Build:
       - frequency distributions for categorical fields
       - aggregated text summaries for freeform fields
       - a PRD-ready summary block
+    reports may be any iterable, such as a generator reading a file; it is
+    consumed once.
     """
-    frequency_dist = {}
-
-    for field in CATEGORICAL_FIELDS:
-        values = [r.get(field) for r in reports if field in r]
-        frequency_dist[field] = compute_frequency(values)
-
-    # Collect unique text entries for freeform fields
-    text_aggregates = {}
-    for field in TEXT_FIELDS:
-        seen = []
-        for r in reports:
-            v = r.get(field, "").strip()
-            if v and v not in seen:
-                seen.append(v)
-        text_aggregates[field] = seen
+    # Gather everything in one walk over the reports. Text entries are
+    # deduped in first-seen order using dict keys.
+    counters = {field: Counter() for field in CATEGORICAL_FIELDS}
+    texts = {field: {} for field in TEXT_FIELDS}
+    crashes = 0
+    total = 0
+
+    # Pair each field with its tally up front so the per-report loops
+    # don't look the counter up by name every time
+    categorical = tuple(counters.items())
+    freeform = tuple(texts.items())
+
+    for r in reports:
+        total += 1
+        for field, counter in categorical:
+            if field in r:
+                counter[str(r[field])] += 1
+        for field, seen in freeform:
+            value = r.get(field, "").strip()
+            if value:
+                seen[value] = None
+        if r.get("crash", False):
+            crashes += 1
+
+    frequency_dist = {field: compute_frequency(counters[field]) for field in CATEGORICAL_FIELDS}
+    text_aggregates = {field: list(texts[field]) for field in TEXT_FIELDS}
 
     # Derive crash rate
-    crash_flags = [r.get("crash", False) for r in reports]
-    crash_rate = round(sum(1 for c in crash_flags if c) / len(crash_flags) * 100, 1) if crash_flags else 0
+    crash_rate = round(crashes / total * 100, 1) if total else 0
 
-    # Most common frustration level
-    frustration_dist = dict(frequency_dist.get("user_frustration", []))
-    top_frustration = max(frustration_dist.items(), key=lambda x: x[1])[0] if frustration_dist else "unknown"
+    # Distributions are sorted most common first, and are empty when no
+    # report has the field (including when there are no reports at all)
+    def top(field: str) -> str:
+        dist = frequency_dist[field]
+        return dist[0][0] if dist else "unknown"
 
     prd_summary = {
         "issue_id": issue_id,
-        "total_reports": len(reports),
+        "total_reports": total,
         "crash_rate_pct": crash_rate,
-        "dominant_frustration_level": top_frustration,
-        "top_affected_platform": frequency_dist["platform"][0][0] if frequency_dist.get("platform") else "unknown",
-        "top_affected_version": frequency_dist["software_version"][0][0] if frequency_dist.get("software_version") else "unknown",
-        "primary_bug_behaviour": frequency_dist["bug_behaviour"][0][0] if frequency_dist.get("bug_behaviour") else "unknown",
+        "dominant_frustration_level": top("user_frustration"),
+        "top_affected_platform": top("platform"),
+        "top_affected_version": top("software_version"),
+        "primary_bug_behaviour": top("bug_behaviour"),
     }
 
     return {
@@ -457,34 +676,30 @@ def analyze_issue(issue_id: str, reports: list) -> dict:
     }
 
 
-def analyze_with_mcp(features_file: Path, issue_id: str, comments_file: Path) -> Dict:
+def analyze_with_mcp(features_file: Path, issue_id: str, issue_title: str = "", pending_summary: Optional[Future] = None) -> Dict:
     """
     Step 3: Analyze bug reports and generate PRD summary.
+    If pending_summary is given, collects an already started LLM summary.
     """
     print(f"\n{section(3, f'{Symbols.GEAR} Analyzing Bug Reports')}")
     
-    # Load features
-    reports = []
-    with open(features_file) as f:
-        for line in f:
-            line = line.strip()
-            if line:
-                reports.append(json.loads(line))
+    # Stream features into the analysis, keeping back only the first few
+    # reports in case the LLM summary still has to be run here
+    sample = []
     
-    # Get issue title from comments file
-    issue_title = ""
-    try:
-        with open(comments_file) as f:
-            rows = json.load(f)
-            if rows:
-                issue_title = rows[0].get("issue_title", "")
-    except:
-        pass
+    def read_reports():
+        with open(features_file, "rb") as f:
+            for line in f:
+                if line.strip():
+                    report = loads(line)
+                    if len(sample) < SUMMARY_REPORTS:
+                        sample.append(report)
+                    yield report
     
-    result = analyze_issue(issue_id, reports)
+    result = analyze_issue(issue_id, read_reports())
     
     # Generate LLM summary of bug nature
-    bug_nature_summary = summarize_bug_nature(reports, issue_title)
+    bug_nature_summary = summarize_bug_nature(sample, issue_title, pending_summary)
     result["bug_nature_summary"] = bug_nature_summary
     
     # Print summary box
@@ -516,7 +731,9 @@ def generate_prd(mcp_result: Dict, output_dir: Path, run_uuid: str) -> Path:
     
     bug_nature = mcp_result.get('bug_nature_summary', '')
     
-    prd = f"""# Product Requirements Document (PRD)
+    # Collect fragments and join once at the end; repeated += on a str
+    # recopies everything written so far
+    parts = [f"""# Product Requirements Document (PRD)
 
 ## Bug Analysis Report
 
@@ -539,26 +756,23 @@ def generate_prd(mcp_result: Dict, output_dir: Path, run_uuid: str) -> Path:
 
 ### Frequency Distributions
 
-"""
+"""]
     
     for field, dist in mcp_result['frequency_distributions'].items():
-        prd += f"\n#### {field.replace('_', ' ').title()}\n"
-        for value, count in dist:
-            prd += f"- {value}: {count}\n"
+        parts.append(f"\n#### {field.replace('_', ' ').title()}\n")
+        # One string per distribution, unpacking most_common()'s tuples directly
+        parts.append("".join(f"- {value}: {count}\n" for value, count in dist))
     
-    prd += "\n### Technical Descriptions\n\n"
-    for desc in mcp_result['text_aggregates'].get('technical_description', []):
-        prd += f"- {desc}\n"
+    parts.append("\n### Technical Descriptions\n\n")
+    parts.extend(f"- {desc}\n" for desc in mcp_result['text_aggregates'].get('technical_description', []))
     
-    prd += "\n### Expected Behaviour\n\n"
-    for exp in mcp_result['text_aggregates'].get('expected_behaviour', []):
-        prd += f"- {exp}\n"
+    parts.append("\n### Expected Behaviour\n\n")
+    parts.extend(f"- {exp}\n" for exp in mcp_result['text_aggregates'].get('expected_behaviour', []))
     
-    prd += "\n### Input Data\n\n"
-    for inp in mcp_result['text_aggregates'].get('input_data', []):
-        prd += f"- {inp}\n"
+    parts.append("\n### Input Data\n\n")
+    parts.extend(f"- {inp}\n" for inp in mcp_result['text_aggregates'].get('input_data', []))
     
-    prd += """
+    parts.append("""
 ## Fix Requirements
 
 Based on the analysis above, the fix should address:
@@ -574,10 +788,9 @@ Based on the analysis above, the fix should address:
 - Test with the input data scenarios described above
 - Ensure the fix handles all reported versions
 - Verify expected behaviour is met
-"""
+""")
     
-    with open(prd_file, "w") as f:
-        f.write(prd)
+    prd_file.write_text("".join(parts))
     
     print(f"  {success(f'Generated PRD')}")
     print_tree_item(f"File: {c(str(prd_file), Colors.DIM)}", is_last=True)
@@ -585,25 +798,38 @@ Based on the analysis above, the fix should address:
     return prd_file
 
 
-def find_commenters(comments_file: Path) -> List[str]:
+# Accounts that can never review a fix
+BOT_ACCOUNTS = {"ghost", "github-actions", "dependabot", "codecov", "stale", "renovate"}
+
+
+def is_bot(author: str) -> bool:
+    """Return True for bot and placeholder accounts."""
+    return author.endswith("[bot]") or author.lower() in BOT_ACCOUNTS
+
+
+def find_commenters(rows: List[Dict]) -> List[str]:
     """
-    Extract unique author usernames from comments.
+    Extract unique author usernames from comments, in order of first appearance.
+    Bots are left out so they don't use up reviewer checks.
     """
-    with open(comments_file) as f:
-        rows = json.load(f)
-    
-    authors = set()
-    for row in rows:
-        author = row.get("author")
-        if author:
-            authors.add(author)
-    
-    return list(authors)
+    authors = dict.fromkeys(row.get("author") for row in rows)
+    return [author for author in authors if author and not is_bot(author)]
+
+
+def start_reviewer_check(repo: str, authors: List[str]) -> Optional[Future]:
+    """
+    Kick off the Yutori reviewer checks in the background.
+    Returns a future for the results, or None if the check will be skipped.
+    """
+    if not os.environ.get("YUTORI_API_KEY"):
+        return None
+    return background.submit(check_reviewers_bulk, authors, repo)
 
 
-def find_competent_reviewers(repo: str, authors: List[str]) -> tuple:
+def find_competent_reviewers(repo: str, authors: List[str], pending: Optional[Future] = None) -> tuple:
     """
     Step 5: Check if comment authors are competent reviewers using Yutori API.
+    If pending is given, collects the results of an already started check.
     Returns (best_reviewer, all_results).
     """
     print(f"\n{section(5, f'{Symbols.PEOPLE} Finding Competent Reviewers')}")
@@ -613,7 +839,7 @@ def find_competent_reviewers(repo: str, authors: List[str]) -> tuple:
         print(f"  {warning('YUTORI_API_KEY not set, skipping reviewer check')}")
         return None, []
     
-    results = check_reviewers_bulk(authors, repo)
+    results = pending.result() if pending else check_reviewers_bulk(authors, repo)
     
     # Get the best reviewer
     best = get_best_reviewer(results)
@@ -627,18 +853,79 @@ def find_competent_reviewers(repo: str, authors: List[str]) -> tuple:
     return best, results
 
 
-def clone_repo(repo: str, work_dir: Path) -> Path:
+# Shallow clones kept between runs, one per repository
+REPO_CACHE_DIR = Path(os.environ.get("BUGOUT_REPO_CACHE", Path.home() / ".cache" / "bugout" / "repos"))
+
+# One lock per cached clone, so background clones of the same repository in
+# --batch mode don't fetch into and reset it at the same time
+repo_locks = defaultdict(threading.Lock)
+repo_locks_guard = threading.Lock()
+
+
+def repo_lock(repo: str) -> threading.Lock:
+    """Return the lock serializing updates to repo's cached clone."""
+    with repo_locks_guard:
+        return repo_locks[repo]
+
+
+def clone_path_for(repo: str, work_dir: Path) -> Path:
+    """Return where repo is checked out inside work_dir."""
+    return work_dir / repo.split("/")[1]
+
+
+def fetch_repo(repo: str, work_dir: Path) -> tuple:
+    """
+    Bring the cached clone of repo up to date, or create it, then check it out
+    into work_dir. Returns (stdout, stderr, returncode) of the step that failed,
+    or of the final checkout.
+    """
+    cached = REPO_CACHE_DIR / repo.replace("/", "__")
+    clone_path = clone_path_for(repo, work_dir)
+    
+    with repo_lock(repo):
+        if (cached / ".git").is_dir():
+            stdout, stderr, rc = run_command(["git", "-C", str(cached), "fetch", "--depth=1", "origin"])
+            if rc == 0:
+                stdout, stderr, rc = run_command(["git", "-C", str(cached), "reset", "--hard", "FETCH_HEAD"])
+        else:
+            cached.parent.mkdir(parents=True, exist_ok=True)
+            # Only the current tree is read, so skip history and other branches
+            stdout, stderr, rc = run_command(["gh", "repo", "clone", repo, str(cached), "--", "--depth=1", "--single-branch"])
+        
+        if rc != 0:
+            return stdout, stderr, rc
+        
+        # A local clone hardlinks the cached objects, so the working copy can be
+        # patched without touching the cache
+        stdout, stderr, rc = run_command(["git", "clone", "--quiet", str(cached), str(clone_path)])
+    
+    if rc != 0:
+        return stdout, stderr, rc
+    
+    # Cloning from the cache leaves origin pointing at it; point it back at
+    # GitHub so pushing the fix and opening a PR go to the real repository
+    return run_command(["git", "-C", str(clone_path), "remote", "set-url", "origin", f"https://github.com/{repo}.git"])
+
+
+def start_clone(repo: str, work_dir: Path) -> Future:
+    """
+    Kick off the repository clone in the background.
+    Returns a future for the fetch_repo result.
+    """
+    return background.submit(fetch_repo, repo, work_dir)
+
+
+def clone_repo(repo: str, work_dir: Path, pending: Optional[Future] = None) -> Path:
     """
     Step 6: Clone a GitHub repository to a temporary directory.
+    Reuses a cached clone from earlier runs when there is one.
+    If pending is given, collects the result of an already started clone.
     Returns the path to the cloned repository.
     """
     print(f"\n{section(6, f'{Symbols.GIT} Cloning Repository')} {c(repo, Colors.DIM)}")
     
-    repo_name = repo.split("/")[1]
-    clone_path = work_dir / repo_name
-    
-    cmd = ["gh", "repo", "clone", repo, str(clone_path)]
-    stdout, stderr, rc = run_command(cmd)
+    clone_path = clone_path_for(repo, work_dir)
+    stdout, stderr, rc = pending.result() if pending else fetch_repo(repo, work_dir)
     
     if rc != 0:
         print(f"  {error(f'Failed to clone repository: {stderr}')}")
@@ -650,23 +937,47 @@ def clone_repo(repo: str, work_dir: Path) -> Path:
     return clone_path
 
 
-def find_relevant_files(repo_path: Path, prd_content: str, max_files: int = 10) -> List[str]:
+# Characters of file paths packed into one file-selection prompt, and the
+# most prompts sent for one repository
+FILE_LIST_CHARS = 6000
+MAX_FILE_LIST_CHUNKS = 4
+
+SOURCE_EXTENSIONS = {".py", ".js", ".ts", ".java", ".cpp", ".c", ".go", ".rs"}
+
+# Directories that never hold the project's own source
+SKIP_DIRS = {".git", "node_modules", "venv", ".venv", "__pycache__", "vendor", "dist", "build"}
+
+
+def iter_source_files(repo_path: Path) -> Iterator[str]:
+    """Yield repo-relative paths of source files in a single pruned walk."""
+    for root, dirs, files in os.walk(repo_path):
+        dirs[:] = sorted(d for d in dirs if d not in SKIP_DIRS)
+        rel_root = os.path.relpath(root, repo_path)
+        for name in sorted(files):
+            if os.path.splitext(name)[1] in SOURCE_EXTENSIONS:
+                yield name if rel_root == "." else os.path.join(rel_root, name)
+
+
+def chunk_file_list(paths: Iterable[str], budget: int = FILE_LIST_CHARS, max_chunks: int = MAX_FILE_LIST_CHUNKS) -> List[List[str]]:
     """
-    Use LLM to identify relevant files in the repository based on the PRD.
+    Pack paths into consecutive chunks of at most budget characters each.
+    Stops reading paths once max_chunks chunks are full.
     """
-    print(f"  {c(f'{Symbols.MAGNIFYING_GLASS} Identifying relevant files...', Colors.BRIGHT_YELLOW)}")
-    
-    # Get a list of source files
-    source_files = []
-    for ext in ["*.py", "*.js", "*.ts", "*.java", "*.cpp", "*.c", "*.go", "*.rs"]:
-        source_files.extend(repo_path.rglob(ext))
-    
-    # Sample files (limit to avoid overwhelming the LLM)
-    sample_files = [str(f.relative_to(repo_path)) for f in source_files[:100]]
-    
-    if not sample_files:
-        return []
-    
+    chunks = [[]]
+    size = 0
+    for path in paths:
+        if chunks[-1] and size + len(path) > budget:
+            if len(chunks) == max_chunks:
+                break
+            chunks.append([])
+            size = 0
+        chunks[-1].append(path)
+        size += len(path) + 3
+    return chunks if chunks[0] else []
+
+
+def pick_relevant_files(prd_content: str, paths: List[str], max_files: int) -> List[str]:
+    """Ask the LLM for the most relevant of paths, most relevant first."""
     prompt = f"""Given the following bug report, identify the most relevant files to investigate:
 
 Bug Report:
@@ -675,26 +986,48 @@ Bug Report:
 Available files (sample):
 """
     
-    for f in sample_files:
+    for f in paths:
         prompt += f"\n- {f}"
     
     prompt += f"\n\nList the top {max_files} most relevant file paths, one per line. Only output file paths, nothing else."
     
+    response = call_llm(
+        prompt,
+        system_prompt="You are a code analyst. Identify files most likely to contain the bug based on the report.",
+        max_tokens=500
+    )
+    
+    # Parse response to get file paths
+    files = []
+    for line in response.strip().split("\n"):
+        line = line.strip()
+        if line and not line.startswith("-"):
+            files.append(line)
+        elif line.startswith("-"):
+            files.append(line[1:].strip())
+    return files
+
+
+def find_relevant_files(repo_path: Path, prd_content: str, max_files: int = 10) -> List[str]:
+    """
+    Use LLM to identify relevant files in the repository based on the PRD.
+    The file list is packed into a few prompts that are sent concurrently,
+    and their picks are merged.
+    """
+    print(f"  {c(f'{Symbols.MAGNIFYING_GLASS} Identifying relevant files...', Colors.BRIGHT_YELLOW)}")
+    
+    # The walk stops as soon as the prompts are full, to avoid overwhelming the LLM
+    chunks = chunk_file_list(iter_source_files(repo_path))
+    
+    if not chunks:
+        return []
+    
     try:
-        response = call_llm(
-            prompt,
-            system_prompt="You are a code analyst. Identify files most likely to contain the bug based on the report.",
-            max_tokens=500
-        )
+        with ThreadPoolExecutor(max_workers=len(chunks)) as pool:
+            picks = list(pool.map(lambda chunk: pick_relevant_files(prd_content, chunk, max_files), chunks))
         
-        # Parse response to get file paths
-        files = []
-        for line in response.strip().split("\n"):
-            line = line.strip()
-            if line and not line.startswith("-"):
-                files.append(line)
-            elif line.startswith("-"):
-                files.append(line[1:].strip())
+        # Interleave each prompt's ranking so every chunk's top picks come first
+        files = list(dict.fromkeys(f for rank in zip_longest(*picks) for f in rank if f))
         
         print(f"  {success(f'Identified {c(str(len(files)), Colors.BRIGHT_YELLOW)} relevant files')}")
         return files[:max_files]
@@ -740,12 +1073,10 @@ def agentic_fix_generation(repo_path: Path, prd_file: Path, output_dir: Path) ->
     for i, file in enumerate(relevant_files):
         print_tree_item(c(file, Colors.DIM), is_last=(i == len(relevant_files)-1))
     
-    # Read relevant file contents
-    file_contents = {}
-    for file_path in relevant_files:
-        content = read_file_content(repo_path, file_path)
-        if content:
-            file_contents[file_path] = content
+    # Read relevant file contents, overlapping the reads
+    with ThreadPoolExecutor(max_workers=min(8, len(relevant_files))) as pool:
+        contents = pool.map(lambda file_path: read_file_content(repo_path, file_path), relevant_files)
+        file_contents = {file_path: content for file_path, content in zip(relevant_files, contents) if content}
     
     # Generate fix
     print(f"  {c(f'{Symbols.LIGHTBULB} Querying LLM for fix proposal...', Colors.BRIGHT_YELLOW)}")
@@ -758,10 +1089,11 @@ Bug Report:
 Relevant Files:
 """
     
-    for file_path, content in file_contents.items():
+    # Truncate content to avoid token limits
+    clipped = share_budget(list(file_contents.values()), FILE_CONTEXT_CHARS)
+    for file_path, content in zip(file_contents, clipped):
         prompt += f"\n\n=== {file_path} ===\n"
-        # Truncate content to avoid token limits
-        prompt += content[:3000]
+        prompt += content
     
     prompt += """
 
@@ -790,8 +1122,7 @@ FIX:
         
         # Save fix proposal
         fix_proposal_file = output_dir / "fix_proposal.md"
-        with open(fix_proposal_file, "w") as f:
-            f.write(fix_content)
+        fix_proposal_file.write_text(fix_content)
         
         print(f"  {success('Fix proposal generated')}")
         print_tree_item(f"File: {c(str(fix_proposal_file), Colors.DIM)}", is_last=True)
@@ -803,6 +1134,13 @@ FIX:
         return ""
 
 
+# A fenced diff block in the LLM response, or failing that, a run of bare
+# hunks. Each line is matched with [^\n]* so a malformed response can't
+# trigger runaway backtracking.
+DIFF_FENCE = re.compile(r"```diff\n(.*?)```", re.DOTALL)
+DIFF_HUNKS = re.compile(r"(?:@@[^\n]*@@[^\n]*\n(?:[-+@ ][^\n]*\n)+)+")
+
+
 def generate_patch_file(repo_path: Path, fix_content: str, output_dir: Path) -> Path:
     """
     Step 8: Generate a proper patch file from the fix content.
@@ -813,22 +1151,20 @@ def generate_patch_file(repo_path: Path, fix_content: str, output_dir: Path) ->
     patch_file = output_dir / "fix.patch"
     
     # Extract diff from fix_content
-    import re
-    diff_match = re.search(r'```diff\n(.*?)```', fix_content, re.DOTALL)
+    diff_match = DIFF_FENCE.search(fix_content)
     
     if diff_match:
         diff_content = diff_match.group(1)
     else:
         # Try to find any diff-like content
-        diff_match = re.search(r'(@@.*@@.*\n[-+@ ].*\n)+', fix_content, re.DOTALL)
+        diff_match = DIFF_HUNKS.search(fix_content)
         if diff_match:
             diff_content = diff_match.group(0)
         else:
             diff_content = fix_content  # Use full content if no diff found
     
     # Write patch file
-    with open(patch_file, "w") as f:
-        f.write(diff_content)
+    patch_file.write_text(diff_content)
     
     print(f"  {success('Patch file generated')}")
     print_tree_item(f"File: {c(str(patch_file), Colors.DIM)}", is_last=True)
@@ -836,6 +1172,30 @@ def generate_patch_file(repo_path: Path, fix_content: str, output_dir: Path) ->
     return patch_file
 
 
+def _fast_copy(src: Path, dst: Path):
+    """Hardlink src to dst, falling back to a kernel-side copy across filesystems."""
+    # A re-run may find dst already linked to src; otherwise drop the stale copy
+    if dst.exists():
+        if os.path.samefile(src, dst):
+            return
+        dst.unlink()
+    try:
+        os.link(src, dst)
+        return
+    except OSError:
+        pass
+    # copy_file_range keeps the copy in the kernel and reflinks on btrfs/XFS
+    if hasattr(os, "copy_file_range"):
+        try:
+            with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+                while os.copy_file_range(fsrc.fileno(), fdst.fileno(), 1 << 30):
+                    pass
+            return
+        except OSError:
+            pass
+    shutil.copyfile(src, dst)
+
+
 def prepare_patch_folder(
     repo: str,
     issue_number: str,
@@ -864,24 +1224,26 @@ def prepare_patch_folder(
     }
     
     reviewer_file = patch_dir / "reviewer.json"
-    with open(reviewer_file, "w") as f:
-        json.dump(reviewer_data, f, indent=2)
+    dump_file(reviewer_data, reviewer_file, indent=True)
     
     # Copy PRD
-    shutil.copy(prd_file, patch_dir / "prd.md")
+    _fast_copy(prd_file, patch_dir / "prd.md")
     
     # Copy patch file
-    shutil.copy(patch_file, patch_dir / "fix.patch")
+    _fast_copy(patch_file, patch_dir / "fix.patch")
     
     # Copy fix proposal if exists
     fix_proposal = output_dir / "fix_proposal.md"
     if fix_proposal.exists():
-        shutil.copy(fix_proposal, patch_dir / "fix_proposal.md")
+        _fast_copy(fix_proposal, patch_dir / "fix_proposal.md")
     
-    # Copy all relevant work files
-    for file in output_dir.iterdir():
-        if file.is_file():
-            shutil.copy(file, patch_dir / file.name)
+    # Copy all relevant work files not already placed above
+    placed = {"reviewer.json", "prd.md", "fix.patch", "fix_proposal.md"}
+    with os.scandir(output_dir) as entries:
+        for entry in entries:
+            # DirEntry knows its type from the directory listing, so no stat per file
+            if entry.is_file(follow_symlinks=False) and entry.name not in placed:
+                _fast_copy(Path(entry.path), patch_dir / entry.name)
     
     print(f"  {success(f'Patch folder prepared at {c(str(patch_dir), Colors.BRIGHT_CYAN)}')}")
     print_tree_item(f"reviewer.json", is_last=False)
@@ -892,17 +1254,11 @@ def prepare_patch_folder(
     return patch_dir
 
 
-def main():
-    if len(sys.argv) < 3:
-        print_banner()
-        print(f"\n{error('Missing required arguments')}\n")
-        print(f"  {bold('Usage:')} python bugout.py <repo> <bug_number>")
-        print(f"  {bold('Example:')} python bugout.py microsoft/vscode 12345\n")
-        sys.exit(1)
-    
-    repo = sys.argv[1]
-    issue_number = sys.argv[2]
-    
+def run_bugout(repo: str, issue_number: str, prefetched: Optional[Dict] = None) -> bool:
+    """
+    Run the whole pipeline for one issue. prefetched is passed on to
+    fetch_issue_comments. Returns False if any step failed.
+    """
     # Generate UUID for this run
     run_uuid = str(uuid.uuid4())[:8]
     
@@ -922,23 +1278,31 @@ def main():
     
     try:
         # Step 1: Fetch comments
-        comments_file = fetch_issue_comments(repo, issue_number, output_dir)
+        _, rows = fetch_issue_comments(repo, issue_number, output_dir, prefetched)
+        issue_title = rows[0].get("issue_title", "") if rows else ""
+        
+        # Reviewer lookup only needs the commenters, the LLM summary only
+        # needs the comment text and the clone needs neither, so all three
+        # run alongside feature extraction
+        authors = find_commenters(rows)
+        reviewer_check = start_reviewer_check(repo, authors)
+        bug_summary = start_bug_summary(rows, issue_title)
+        clone = start_clone(repo, work_dir)
         
         # Step 2: Extract features
-        features_file = extract_features(comments_file, output_dir)
+        features_file = extract_features(rows, output_dir)
         
         # Step 3: Analyze with MCP
-        mcp_result = analyze_with_mcp(features_file, issue_number, comments_file)
+        mcp_result = analyze_with_mcp(features_file, issue_number, issue_title, bug_summary)
         
         # Step 4: Generate PRD
         prd_file = generate_prd(mcp_result, output_dir, run_uuid)
         
         # Step 5: Find competent reviewers
-        authors = find_commenters(comments_file)
-        reviewer, reviewer_results = find_competent_reviewers(repo, authors)
+        reviewer, reviewer_results = find_competent_reviewers(repo, authors, reviewer_check)
         
         # Step 6: Clone repository
-        repo_path = clone_repo(repo, work_dir)
+        repo_path = clone_repo(repo, work_dir, clone)
         
         # Step 7: Agentic fix generation
         fix_content = agentic_fix_generation(repo_path, prd_file, output_dir)
@@ -981,6 +1345,55 @@ def main():
         print(f"{c(f'{Symbols.PIPE}', Colors.BRIGHT_RED)} {error('Execution Failed'):^56} {c(f'{Symbols.PIPE}', Colors.BRIGHT_RED)}")
         print(f"{c(f'{Symbols.CORNER_BL}{Symbols.DIVIDER_THICK*58}{Symbols.CORNER_BR}', Colors.BRIGHT_RED)}")
         print(f"\n{error(f'{e}')}\n")
+        return False
+    
+    return True
+
+
+def read_batch_file(path: str) -> List[Tuple[str, str]]:
+    """Read owner/name#number lines, skipping blanks and # comments. Malformed lines are reported and skipped."""
+    issues = []
+    for lineno, line in enumerate(Path(path).read_text().splitlines(), 1):
+        line = line.strip()
+        if not line or line.startswith("#"):
+            continue
+        repo, _, number = line.rpartition("#")
+        owner, _, name = repo.partition("/")
+        if not (owner and name and number.isdigit()):
+            print(f"  {warning(f'Skipping {path}:{lineno}: expected owner/name#number, got {line!r}')}")
+            continue
+        issues.append((repo, number))
+    return issues
+
+
+def print_usage():
+    """Print command line usage."""
+    print(f"  {bold('Usage:')} python bugout.py <repo> <bug_number>")
+    print("         python bugout.py --batch <file of repo#number lines>")
+    print(f"  {bold('Example:')} python bugout.py microsoft/vscode 12345\n")
+
+
+def main():
+    if len(sys.argv) < 3:
+        print_banner()
+        print(f"\n{error('Missing required arguments')}\n")
+        print_usage()
+        sys.exit(1)
+    
+    if sys.argv[1] != "--batch":
+        if not run_bugout(sys.argv[1], sys.argv[2]):
+            sys.exit(1)
+        return
+    
+    # Batch mode: one process, one GitHub connection and a handful of
+    # GraphQL requests for all issues; the pipelines then run one after another
+    issues = read_batch_file(sys.argv[2])
+    prefetched = prefetch_issues(issues)
+    failed = [f"{repo}#{number}" for repo, number in issues
+              if not run_bugout(repo, number, prefetched.get((repo, number)))]
+    
+    if failed:
+        print(f"{error(f'{len(failed)} of {len(issues)} issues failed:')} {', '.join(failed)}\n")
         sys.exit(1)
 
 
@@ -0,0 +1,50 @@
+#!/usr/bin/env python3
+"""
+cache.py - Content-addressed on-disk cache for deterministic API responses
+"""
+
+import os
+import json
+import time
+import hashlib
+import threading
+from pathlib import Path
+from typing import Any, Optional
+
+from jsonio import load_file, dumps
+
+CACHE_DIR = Path(os.environ.get("BUGOUT_CACHE_DIR", ".bugout_cache"))
+
+# Set BUGOUT_NO_CACHE=1 to ignore existing entries; fresh results are still stored
+NO_CACHE = os.environ.get("BUGOUT_NO_CACHE", "") not in ("", "0")
+
+
+def cache_key(*parts: Any) -> str:
+    """Return a SHA-256 hex digest identifying the given JSON-serializable parts."""
+    # Stays on stdlib json so keys match across installs with and without orjson
+    return hashlib.sha256(json.dumps(parts, sort_keys=True).encode()).hexdigest()
+
+
+def cache_get(namespace: str, key: str, max_age: Optional[float] = None) -> Optional[Any]:
+    """
+    Return the cached value for key, or None on a miss.
+    Entries older than max_age seconds count as misses.
+    """
+    if NO_CACHE:
+        return None
+    path = CACHE_DIR / namespace / f"{key}.json"
+    try:
+        if max_age is not None and time.time() - path.stat().st_mtime > max_age:
+            return None
+        return load_file(path)
+    except (OSError, ValueError):
+        return None
+
+
+def cache_put(namespace: str, key: str, value: Any) -> None:
+    """Store value under key, replacing any previous entry atomically."""
+    path = CACHE_DIR / namespace / f"{key}.json"
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    tmp.write_bytes(dumps(value))
+    os.replace(tmp, path)
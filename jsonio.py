@@ -0,0 +1,37 @@
+#!/usr/bin/env python3
+"""
+jsonio.py - JSON helpers that use orjson when it is installed
+"""
+
+import json
+from pathlib import Path
+from typing import Any, Union
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def loads(data: Union[str, bytes]) -> Any:
+    """Parse a JSON document from str or bytes."""
+    if orjson:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def dumps(obj: Any, indent: bool = False) -> bytes:
+    """Serialize obj to UTF-8 encoded JSON bytes, optionally indented by two spaces."""
+    if orjson:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0)
+    return json.dumps(obj, indent=2 if indent else None, ensure_ascii=False).encode()
+
+
+def load_file(path: Union[str, Path]) -> Any:
+    """Read and parse a JSON file."""
+    return loads(Path(path).read_bytes())
+
+
+def dump_file(obj: Any, path: Union[str, Path], indent: bool = False) -> None:
+    """Serialize obj and write it to path in a single write."""
+    Path(path).write_bytes(dumps(obj, indent))
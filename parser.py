@@ -1,41 +1,177 @@
 #!/usr/bin/env python3
-import requests, os, uuid
-import curlify
+import requests, os, sys, uuid
 import json
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from itertools import chain, islice
+from urllib3.util.retry import Retry
 from dotenv import load_dotenv
+from cache import cache_key, cache_get, cache_put
+from jsonio import loads, dumps
 
-load_dotenv()
-import csv, sys
-csv.field_size_limit(100000000000)
-key = os.environ.get("FASTINO_KEY")
+# Inference calls are pure network wait, so keep this many in flight at once.
+MAX_WORKERS = max(1, int(os.environ.get("FASTINO_WORKERS", "32")))
 
-with open(sys.argv[1]) as obj:
-    rows= json.loads(obj.read())
-print("loaded", file=sys.stderr)
+# Rows packed into a single inference request. The model is tuned for one
+# object per call, so this stays at 1 unless FASTINO_BATCH_SIZE asks for more.
+BATCH_SIZE = max(1, int(os.environ.get("FASTINO_BATCH_SIZE", "1")))
 
-for row in rows:
-    response = requests.post(
+MODEL_ID = "839c367a-bfa3-4b78-8f3e-85c44f619106"
+SYSTEM_PROMPT = "You are an inference engine that processes text and outputs strict json with the following labels to the dict object: software version, platform, bug behaviour, crash, user frustration, technical description, input data, expected behaviour. You are not conversational."
+BATCH_SYSTEM_PROMPT = SYSTEM_PROMPT + " When given a numbered list of inputs, output a strict json array holding one such dict object per input, in the same order."
+
+# (connect, read) timeouts so a hung connection can't stall a worker forever.
+TIMEOUT = (10, 60)
+
+# Back off and retry on connection errors, rate limiting and 5xx responses.
+# POST is listed explicitly since urllib3 only retries idempotent verbs by default.
+RETRY = Retry(total=5, backoff_factor=1, status_forcelist=(429, 500, 502, 503, 504), allowed_methods=None)
+
+# One pooled session so every worker reuses an open TLS connection instead of
+# paying a fresh handshake per row. pool_block makes a worker wait for a free
+# connection rather than opening a throwaway one past pool_maxsize.
+session = requests.Session()
+session.mount("https://", requests.adapters.HTTPAdapter(pool_connections=1, pool_maxsize=MAX_WORKERS, max_retries=RETRY, pool_block=True))
+session.headers.update({
+    "Content-Type": "application/json",
+    "Connection": "keep-alive",
+    # Read at import, so importers must load .env first (bugout.py does);
+    # main() loads it and refreshes this when run as a script.
+    "X-API-Key": os.environ.get("FASTINO_KEY")
+})
+
+def iter_rows(f):
+    """Yield rows from a JSON array or JSON-lines file without reading it all first."""
+    first = f.read(1)
+    while first.isspace():
+        first = f.read(1)
+    if first != "[":
+        for line in chain([first + f.readline()], f):
+            if line.strip():
+                yield loads(line)
+        return
+    decoder = json.JSONDecoder()
+    buf = ""
+    while True:
+        buf = buf.lstrip()
+        if buf.startswith(","):
+            buf = buf[1:].lstrip()
+        if buf.startswith("]"):
+            return
+        try:
+            row, end = decoder.raw_decode(buf)
+        except ValueError:
+            # Row is still incomplete; pull in more of the file.
+            chunk = f.read(1 << 16)
+            if not chunk:
+                raise
+            buf += chunk
+            continue
+        yield row
+        buf = buf[end:]
+
+# Stands in for the user message while the rest of the request body is serialized.
+PLACEHOLDER = "\0content\0"
+
+@lru_cache(maxsize=None)
+def payload_template(system_prompt, max_tokens):
+    """Return the encoded request body split around the user message content."""
+    body = dumps({
+        "model_id": MODEL_ID,
+        "task": "generate",
+        "messages": [
+            { "role": "system", "content": system_prompt },
+            { "role": "user", "content": PLACEHOLDER } ],
+        "temperature": 0,
+        "max_tokens": max_tokens
+    })
+    prefix, suffix = body.split(dumps(PLACEHOLDER))
+    return prefix, suffix
+
+def infer(system_prompt, content, max_tokens):
+    # temperature is 0, so the same prompt always gets the same answer.
+    k = cache_key(MODEL_ID, system_prompt, content, max_tokens)
+    completion = cache_get("fastino", k)
+    if completion is not None:
+        return completion
+    prefix, suffix = payload_template(system_prompt, max_tokens)
+    response = session.post(
         "https://api.pioneer.ai/inference",
-        headers={
-            "Content-Type": "application/json",
-            "X-API-Key": key
-        },
-        json={
-            "model_id": "839c367a-bfa3-4b78-8f3e-85c44f619106",
-            "task": "generate",
-            "messages": [ 
-                { "role": "system", "content": "You are an inference engine that processes text and outputs strict json with the following labels to the dict object: software version, platform, bug behaviour, crash, user frustration, technical description, input data, expected behaviour. You are not conversational." },
-                { "role": "user", "content": row.get('text') } ],
-            "temperature": 0,
-            "max_tokens": 256
-        }
+        data=prefix + dumps(content) + suffix,
+        timeout=TIMEOUT
     )
+    response.raise_for_status()
+    completion = response.json().get('completion')
+    if completion is not None:
+        cache_put("fastino", k, completion)
+    return completion
 
+def describe(row):
+    return repr((row.get('text') or '')[:40])
+
+def process(row):
     try:
-        obj = response.json()
+        features = loads(infer(SYSTEM_PROMPT, row.get('text'), 256))
         row['uuid'] = str(uuid.uuid4())
-        row.update(json.loads(obj.get('completion')))
-        print(json.dumps(row))
-        sys.stdout.flush()
-    except:
-        pass
+        row.update(features)
+        return row
+    except requests.RequestException as e:
+        print(f"skipping row {describe(row)}: request failed: {e}", file=sys.stderr)
+    except (ValueError, KeyError, TypeError) as e:
+        print(f"skipping row {describe(row)}: bad completion: {e}", file=sys.stderr)
+    return None
+
+def process_batch(batch):
+    if len(batch) > 1:
+        content = f"Process the following {len(batch)} inputs and return a JSON array of objects in order:\n"
+        content += "\n".join(f"{i}. {dumps(row.get('text')).decode()}" for i, row in enumerate(batch, 1))
+        try:
+            results = loads(infer(BATCH_SYSTEM_PROMPT, content, 256 * len(batch)))
+        except (requests.RequestException, ValueError, TypeError):
+            results = None
+        if isinstance(results, list) and len(results) == len(batch) and all(isinstance(r, dict) for r in results):
+            for row, features in zip(batch, results):
+                row['uuid'] = str(uuid.uuid4())
+                row.update(features)
+            return batch
+    # Single rows, or a batch answer we could not line up with its inputs.
+    return [process(row) for row in batch]
+
+def batches(rows, size):
+    it = iter(rows)
+    while batch := list(islice(it, size)):
+        yield batch
+
+# Rows written between explicit flushes of stdout.
+FLUSH_EVERY = 64
+
+def extract(rows):
+    """Yield each row merged with its extracted features, in input order."""
+    # Only a couple of batches per worker are read ahead, unlike pool.map which
+    # would pull the whole input in up front. Results are taken oldest first, so
+    # output order still matches the input.
+    pending = deque()
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as pool:
+        for batch in batches(rows, BATCH_SIZE):
+            pending.append(pool.submit(process_batch, batch))
+            if len(pending) >= 2 * MAX_WORKERS:
+                yield from filter(None, pending.popleft().result())
+        while pending:
+            yield from filter(None, pending.popleft().result())
+
+def main():
+    load_dotenv()
+    session.headers["X-API-Key"] = os.environ.get("FASTINO_KEY")
+    out = sys.stdout.buffer
+    written = 0
+    with open(sys.argv[1]) as obj:
+        for row in extract(iter_rows(obj)):
+            out.write(dumps(row) + b"\n")
+            written += 1
+            if written % FLUSH_EVERY == 0:
+                out.flush()
+    out.flush()
+
+if __name__ == "__main__":
+    main()
@@ -1,6 +1,13 @@
-import csv, sys
-csv.field_size_limit(100000000000)
-rdr = csv.reader(sys.stdin)
-wtr = csv.writer(sys.stdout, lineterminator='\n')
-for row in rdr:
-  wtr.writerow([f.replace('\n','\\n') for f in row])
+import sys
+# Escape newlines inside quoted CSV fields so every record sits on one line.
+# Splitting on '"' leaves quoted text in every other piece ("" escapes toggle
+# twice and cancel out), so this never has to parse the CSV itself. The
+# input is read in chunks, carrying whether a chunk starts inside quotes.
+inside = False
+for chunk in iter(lambda: sys.stdin.read(1 << 20), ''):
+  parts = chunk.split('"')
+  start = 0 if inside else 1
+  parts[start::2] = [p.replace('\n','\\n') for p in parts[start::2]]
+  sys.stdout.write('"'.join(parts))
+  if len(parts) % 2 == 0:
+    inside = not inside
@@ -4,11 +4,14 @@ bug_fixer.py - Step 4: Attempt to fix the bug
 """
 
 import json
-import subprocess
+import os
 import sys
+from itertools import islice
 from pathlib import Path
 from typing import Optional, Dict, List
 
+from file_cache import cache_key, cache_get, cache_put
+
 # ANSI Colors
 class Colors:
     RESET = "\033[0m"
@@ -25,54 +28,32 @@ class Colors:
 SYMBOLS = {"check": "✅", "bug": "🐛", "sparkle": "✨"}
 
 
+SOURCE_EXTENSIONS = (".py", ".js", ".ts", ".tsx", ".rs", ".go")
+
+# Vendored, generated and VCS directories that never hold the bug
+SKIP_DIRS = {".git", "node_modules", "__pycache__", "dist", "build"}
+
+
+def iter_source_files(repo_path: str):
+    """Yield source file paths in sorted order, skipping SKIP_DIRS."""
+    for root, dirs, names in os.walk(repo_path):
+        dirs[:] = sorted(d for d in dirs if d not in SKIP_DIRS)
+        for name in sorted(names):
+            if name.endswith(SOURCE_EXTENSIONS):
+                yield os.path.join(root, name)
+
+
 def get_repo_structure(repo_path: str = ".") -> str:
     """Get a summary of the repository structure."""
     try:
-        result = subprocess.run(
-            ["find", repo_path, "-type", "f", "-name", "*.py", "-o", "-name", "*.js", "-o", "-name", "*.ts", "-o", "-name", "*.tsx", "-o", "-name", "*.rs", "-o", "-name", "*.go"],
-            capture_output=True,
-            text=True,
-            timeout=30
-        )
-        files = result.stdout.strip().split('\n')[:50]  # Limit to 50 files
-        return '\n'.join(files)
+        # The walk is lazy, so it stops once the 50th file is found
+        return '\n'.join(islice(iter_source_files(repo_path), 50))  # Limit to 50 files
     except Exception as e:
         return f"Error getting structure: {e}"
 
 
-def generate_fix_prompt(prd_file: Path, features_file: Path) -> str:
-    """Generate a prompt for the AI to create a fix."""
-    with open(prd_file, 'r') as f:
-        prd = f.read()
-    
-    with open(features_file, 'r') as f:
-        features = json.load(f)
-    
-    bugs = features.get("bugs_with_features", [])
-    
-    # Collect technical descriptions
-    tech_descs = [b.get("technical_description", "") for b in bugs if b.get("technical_description")]
-    expected_behaviours = [b.get("expected_behaviour", "") for b in bugs if b.get("expected_behaviour")]
-    
-    prompt = f"""You are an expert software engineer tasked with fixing a bug.
-
-## PRD (Product Requirements Document)
-{prd}
-
-## Bug Reports Summary
-Total reports: {len(bugs)}
-
-### Technical Descriptions from Users:
-"""
-    
-    for i, desc in enumerate(tech_descs[:5], 1):
-        prompt += f"{i}. {desc}\n"
-    
-    prompt += "\n### Expected Behaviour:\n"
-    for i, exp in enumerate(expected_behaviours[:5], 1):
-        prompt += f"{i}. {exp}\n"
-    
-    prompt += """
+# Task and output format that close every fix prompt
+FIX_PROMPT_TASK = """
 ## Your Task
 1. Analyze the bug reports and PRD
 2. Identify the root cause
@@ -95,28 +76,143 @@ Respond with a JSON object:
     "testing_instructions": "How to test the fix"
 }
 """
+
+
+def numbered(items: List[str]) -> str:
+    """Format items as '1. item' lines, each ending in a newline."""
+    return "".join(f"{i}. {item}\n" for i, item in enumerate(items, 1))
+
+
+def generate_fix_prompt(prd_file: Path, features_file: Path) -> str:
+    """Generate a prompt for the AI to create a fix."""
+    with open(prd_file, 'r') as f:
+        prd = f.read()
+    
+    with open(features_file, 'r') as f:
+        features = json.load(f)
+    
+    bugs = features.get("bugs_with_features", [])
+    
+    # Collect technical descriptions
+    tech_descs = [b.get("technical_description", "") for b in bugs if b.get("technical_description")]
+    expected_behaviours = [b.get("expected_behaviour", "") for b in bugs if b.get("expected_behaviour")]
     
-    return prompt
+    return f"""You are an expert software engineer tasked with fixing a bug.
+
+## PRD (Product Requirements Document)
+{prd}
+
+## Bug Reports Summary
+Total reports: {len(bugs)}
+
+### Technical Descriptions from Users:
+{numbered(tech_descs[:5])}
+### Expected Behaviour:
+{numbered(expected_behaviours[:5])}{FIX_PROMPT_TASK}"""
+
+
+MODEL_ID = "839c367a-bfa3-4b78-8f3e-85c44f619106"
+SYSTEM_PROMPT = "You are an expert software engineer. You output strict JSON with code fixes. You are not conversational."
+
+# Fixes are stored by prompt, so a re-run on an unchanged PRD and features skips the call
+FIX_CACHE_NAMESPACE = "qwen_fixes"
+
+
+def load_cached_fix(prompt: str) -> Optional[Dict]:
+    """Return the fix generated earlier for this prompt, or None."""
+    return cache_get(FIX_CACHE_NAMESPACE, cache_key(MODEL_ID, SYSTEM_PROMPT, prompt))
+
+
+def save_cached_fix(prompt: str, fix_data: Dict):
+    """Store a generated fix, replacing any earlier one."""
+    cache_put(FIX_CACHE_NAMESPACE, cache_key(MODEL_ID, SYSTEM_PROMPT, prompt), fix_data)
+
+
+def _close_json(text: str) -> str:
+    """
+    Close the brackets left open in a cut-off JSON document.
+    An array element that was still open is dropped rather than closed up
+    half-written, and a cut inside a string raises ValueError.
+    """
+    # Each open bracket as (closer, offset, whether it is an array element)
+    stack = []
+    in_string = escaped = False
+    for i, ch in enumerate(text):
+        if in_string:
+            if escaped:
+                escaped = False
+            elif ch == "\\":
+                escaped = True
+            elif ch == '"':
+                in_string = False
+        elif ch == '"':
+            in_string = True
+        elif ch in "{[":
+            stack.append(("}" if ch == "{" else "]", i, bool(stack) and stack[-1][0] == "]"))
+        elif ch in "}]" and stack:
+            stack.pop()
+    if in_string:
+        raise ValueError("JSON cut off inside a string")
+    for depth, (_, offset, is_element) in enumerate(stack):
+        if is_element:
+            text = text[:offset]
+            del stack[depth:]
+            break
+    return text.rstrip().rstrip(",") + "".join(closer for closer, _, _ in reversed(stack))
+
+
+def tolerant_json_loads(text: str):
+    """
+    Parse a JSON object from model output, ignoring text around it.
+    An object cut off by max_tokens keeps only the members and array
+    elements that arrived whole.
+
+    Returns:
+        Tuple of (parsed value, whether the document arrived complete)
+    """
+    start = text.find("{")
+    if start < 0:
+        return json.loads(text), True
+    body = text[start:]
+    try:
+        return json.JSONDecoder().raw_decode(body)[0], True
+    except ValueError as e:
+        error = e
+    # Retry from the full text if it stops at the end of a value (a cut
+    # mid-number or mid-literal would read as a different value), then
+    # back through each earlier comma
+    cut = len(body) if body.rstrip()[-1:] in ('"', "}", "]") else body.rfind(",")
+    while cut > 0:
+        try:
+            return json.loads(_close_json(body[:cut])), False
+        except ValueError:
+            cut = body.rfind(",", 0, cut)
+    raise error
 
 
 def generate_fix_with_ai(prompt: str, api_key: str) -> Optional[Dict]:
     """Use AI to generate a fix."""
-    import requests
+    from feature_extractor import session
+    
+    fix_data = load_cached_fix(prompt)
+    if fix_data is not None:
+        print(f"  {Colors.DIM}Using cached fix for this prompt{Colors.RESET}", file=sys.stderr)
+        return fix_data
     
     try:
-        response = requests.post(
+        response = session.post(
             "https://api.pioneer.ai/inference",
             headers={
                 "Content-Type": "application/json",
                 "X-API-Key": api_key
             },
             json={
-                "model_id": "839c367a-bfa3-4b78-8f3e-85c44f619106",
+                "model_id": MODEL_ID,
                 "task": "generate",
                 "messages": [
                     {
                         "role": "system",
-                        "content": "You are an expert software engineer. You output strict JSON with code fixes. You are not conversational."
+                        "content": SYSTEM_PROMPT
                     },
                     {
                         "role": "user",
@@ -130,7 +226,11 @@ def generate_fix_with_ai(prompt: str, api_key: str) -> Optional[Dict]:
         
         obj = response.json()
         completion = obj.get('completion', '{}')
-        fix_data = json.loads(completion)
+        fix_data, complete = tolerant_json_loads(completion)
+        # A fix recovered from cut-off output is used once but not cached,
+        # so the next run asks the model again
+        if fix_data and complete:
+            save_cached_fix(prompt, fix_data)
         return fix_data
     except Exception as e:
         print(f"Error generating fix: {e}", file=sys.stderr)
@@ -139,7 +239,8 @@ def generate_fix_with_ai(prompt: str, api_key: str) -> Optional[Dict]:
 
 def create_patch_file(fix_data: Dict, output_file: Path) -> Optional[Path]:
     """Create a patch file from the fix data."""
-    patch_content = f"""# Bug Fix Patch
+    # Collect the pieces and join once; += would recopy the patch for every change
+    parts = [f"""# Bug Fix Patch
 ## Root Cause
 {fix_data.get('root_cause', 'Unknown')}
 
@@ -150,25 +251,20 @@ def create_patch_file(fix_data: Dict, output_file: Path) -> Optional[Path]:
 {fix_data.get('testing_instructions', 'Unknown')}
 
 ## Code Changes
-"""
+"""]
     
     for change in fix_data.get("code_changes", []):
-        patch_content += f"\n### File: {change.get('file', 'unknown')}\n"
-        patch_content += f"Action: {change.get('action', 'unknown')}\n\n"
+        parts.append(f"\n### File: {change.get('file', 'unknown')}\n")
+        parts.append(f"Action: {change.get('action', 'unknown')}\n\n")
         
         if change.get('old_code'):
-            patch_content += "```diff\n"
-            patch_content += f"- {change['old_code']}\n"
-            patch_content += f"+ {change.get('new_code', '')}\n"
-            patch_content += "```\n"
+            parts.append(f"```diff\n- {change['old_code']}\n+ {change.get('new_code', '')}\n```\n")
         else:
-            patch_content += "```code\n"
-            patch_content += f"{change.get('new_code', '')}\n"
-            patch_content += "```\n"
+            parts.append(f"```code\n{change.get('new_code', '')}\n```\n")
     
     output_file.parent.mkdir(parents=True, exist_ok=True)
     with open(output_file, 'w') as f:
-        f.write(patch_content)
+        f.write("".join(parts))
     
     return output_file
 
@@ -200,8 +296,9 @@ def generate_fix(prd_file: Path, features_file: Path, output_dir: Path, api_key:
     # Save the raw fix data
     fix_json_file = output_dir / "bug_fix.json"
     output_dir.mkdir(parents=True, exist_ok=True)
+    # Encode in one go; json.dump would hand the file one small chunk at a time
     with open(fix_json_file, 'w') as f:
-        json.dump(fix_data, f, indent=2)
+        f.write(json.dumps(fix_data, indent=2))
 
     # Create patch file
     patch_file = output_dir / "bug_fix.patch"
@@ -8,24 +8,20 @@ bugout.py - Main BugOut Orchestrator
 import json
 import sys
 import os
+import shutil
 import uuid
+from concurrent.futures import ThreadPoolExecutor, wait
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional, Tuple
 from dotenv import load_dotenv
 
-# Import all steps
-from comment_fetcher import fetch_issue_comments
-from feature_extractor import process_comments
-from prd_generator import generate_prd_from_file
-from bug_fixer import generate_fix
-from reviewer_checker_wrapper import check_reviewers_for_issue
-from patch_generator import prepare_patch_folder
-from repo_cloner import run_agentic_loop
-from patch_creator import create_patch
-
 # Load .env from parent directory
 load_dotenv(dotenv_path=Path(__file__).parent.parent / ".env")
 
+# Runs steps that only need the fetched comments alongside the main pipeline
+background = ThreadPoolExecutor(max_workers=2)
+
 # ═══════════════════════════════════════════════════════════════════════════════
 # ANSI Color codes
 # ═══════════════════════════════════════════════════════════════════════════════
@@ -86,14 +82,18 @@ SYMBOLS = {
 # Print functions
 # ═══════════════════════════════════════════════════════════════════════════════
 
+@lru_cache(maxsize=None)
+def load_logo() -> str:
+    """Read the logo from the parent directory once, or "" if it is missing."""
+    try:
+        return (Path(__file__).parent.parent / "logo.ansiart").read_text()
+    except OSError:
+        return ""
+
+
 def print_banner():
     """Print the BugOut banner."""
-    # Load logo from parent directory
-    logo_path = Path(__file__).parent.parent / "logo.ansiart"
-    logo = ""
-    if logo_path.exists():
-        with open(logo_path, 'r') as f:
-            logo = f.read()
+    logo = load_logo()
     
     banner = f"""
 {Colors.BRIGHT_CYAN}{logo}{Colors.RESET}
@@ -141,30 +141,20 @@ def print_sub_step(message: str, value: str = ""):
         print(f"    {Colors.DIM}{SYMBOLS['arrow']}{Colors.RESET} {Colors.WHITE}{message}{Colors.RESET}", file=sys.stderr)
 
 
+# API keys and the OpenAI configuration (for step 7)
+REQUIRED_ENV_VARS = ("FASTINO_KEY", "YUTORI_KEY", "OPENAI_HOST", "OPENAI_MODEL")
+
+
 def validate_environment() -> bool:
     """Validate that required environment variables and tools are available."""
     errors = []
 
-    # Check for gh CLI
-    import subprocess
-    try:
-        subprocess.run(["gh", "--version"], capture_output=True, check=True)
-    except (subprocess.CalledProcessError, FileNotFoundError):
-        errors.append("gh CLI not found. Please install GitHub CLI: https://cli.github.com/")
-
-    # Check for FASTINO_KEY
-    if not os.environ.get("FASTINO_KEY"):
-        errors.append("FASTINO_KEY environment variable not set")
+    # GitHub access: a token, or the gh CLI to read one from. A PATH lookup
+    # is enough here, no need to spawn gh itself
+    if not (os.environ.get("GH_TOKEN") or os.environ.get("GITHUB_TOKEN") or shutil.which("gh")):
+        errors.append("gh CLI not found and GH_TOKEN not set. Please install GitHub CLI: https://cli.github.com/")
 
-    # Check for YUTORI_KEY
-    if not os.environ.get("YUTORI_KEY"):
-        errors.append("YUTORI_KEY environment variable not set")
-
-    # Check for OpenAI configuration (for step 7)
-    if not os.environ.get("OPENAI_HOST"):
-        errors.append("OPENAI_HOST environment variable not set")
-    if not os.environ.get("OPENAI_MODEL"):
-        errors.append("OPENAI_MODEL environment variable not set")
+    errors.extend(f"{name} environment variable not set" for name in REQUIRED_ENV_VARS if not os.environ.get(name))
 
     if errors:
         print(f"\n{Colors.BG_MAGENTA}{Colors.BOLD} Environment Validation Failed {Colors.RESET}", file=sys.stderr)
@@ -175,10 +165,19 @@ def validate_environment() -> bool:
     return True
 
 
+def is_fresh(output: Path, *inputs: Path) -> bool:
+    """Return True if output exists and is no older than any existing input."""
+    if not output.exists():
+        return False
+    mtime = output.stat().st_mtime
+    return all(mtime >= i.stat().st_mtime for i in inputs if i.exists())
+
+
 def run_bugout(
     repo: str,
     issue_number: str,
-    output_dir: Optional[Path] = None
+    output_dir: Optional[Path] = None,
+    force: bool = False
 ) -> Tuple[bool, Optional[Path]]:
     """
     Run the complete BugOut workflow.
@@ -187,10 +186,23 @@ def run_bugout(
         repo: Repository in format "owner/repo"
         issue_number: Issue number
         output_dir: Output directory (default: ./bugout_data/<uuid>)
+        force: Rerun steps 2-5 even if their outputs from an earlier run
+            in output_dir are newer than their inputs
 
     Returns:
         Tuple of (success: bool, patch_folder_path: Optional[Path])
     """
+    # The step modules pull in requests and friends, so they're imported only
+    # once a run starts; usage errors and a bad environment exit without them
+    from comment_fetcher import fetch_issue_comments
+    from feature_extractor import process_comments
+    from prd_generator import generate_prd_from_file
+    from bug_fixer import generate_fix
+    from reviewer_checker_wrapper import check_reviewers_for_issue
+    from patch_generator import prepare_patch_folder
+    from repo_cloner import run_agentic_loop
+    from patch_creator import create_patch
+
     # Print banner
     print_banner()
 
@@ -236,59 +248,97 @@ def run_bugout(
         return False, None
     print_step_success(f"Saved: {Colors.DIM}{comments_file}{Colors.RESET}")
 
-    # ═══════════════════════════════════════════════════════════════════════════
-    # Step 2: Extract features
-    # ═══════════════════════════════════════════════════════════════════════════
-    print_step_header(2, total_steps, f"{SYMBOLS['gear']} Extracting features from comments")
-    features_file = output_dir / "bugs_with_features.json"
-    api_key = os.environ.get("FASTINO_KEY")
-    features_result = process_comments(comments_file, api_key, features_file)
-    if not features_result:
-        print_step_error("Could not extract features")
-        return False, None
-    print_step_success(f"Saved: {Colors.DIM}{features_result}{Colors.RESET}")
+    # The reviewer check only needs the commenters, so it runs while
+    # steps 2-4 wait on their APIs; step 5 collects the result
+    reviewer_file = output_dir / "reviewer.json"
+    reviewer_check = None
+    if force or not is_fresh(reviewer_file, comments_file):
+        reviewer_check = background.submit(
+            check_reviewers_for_issue, comments_file, repo, output_dir, wait=False
+        )
 
-    # ═══════════════════════════════════════════════════════════════════════════
-    # Step 3: Generate PRD
-    # ═══════════════════════════════════════════════════════════════════════════
-    print_step_header(3, total_steps, f"{SYMBOLS['target']} Generating PRD")
-    prd_file = output_dir / "prd.md"
-    prd_result = generate_prd_from_file(features_file, prd_file)
-    if not prd_result:
-        print_step_error("Could not generate PRD")
-        return False, None
-    print_step_success(f"Saved: {Colors.DIM}{prd_result}{Colors.RESET}")
+    try:
+        # ═══════════════════════════════════════════════════════════════════════
+        # Step 2: Extract features
+        # ═══════════════════════════════════════════════════════════════════════
+        print_step_header(2, total_steps, f"{SYMBOLS['gear']} Extracting features from comments")
+        features_file = output_dir / "bugs_with_features.json"
+        api_key = os.environ.get("FASTINO_KEY")
+        if not force and is_fresh(features_file, comments_file):
+            features_result = features_file
+            print_step_info("Up to date, reusing the previous run's output")
+        else:
+            features_result = process_comments(comments_file, api_key, features_file)
+        if not features_result:
+            print_step_error("Could not extract features")
+            return False, None
+        print_step_success(f"Saved: {Colors.DIM}{features_result}{Colors.RESET}")
 
-    # ═══════════════════════════════════════════════════════════════════════════
-    # Step 4: Generate bug fix
-    # ═══════════════════════════════════════════════════════════════════════════
-    print_step_header(4, total_steps, f"{SYMBOLS['bug']} Generating bug fix")
-    bug_fix_result = generate_fix(prd_file, features_file, output_dir, api_key)
-    if not bug_fix_result:
-        print_step_error("Could not generate bug fix")
-        return False, None
-    print_step_success(f"Saved: {Colors.DIM}{bug_fix_result}{Colors.RESET}")
+        # ═══════════════════════════════════════════════════════════════════════
+        # Step 3: Generate PRD
+        # ═══════════════════════════════════════════════════════════════════════
+        print_step_header(3, total_steps, f"{SYMBOLS['target']} Generating PRD")
+        prd_file = output_dir / "prd.md"
+        if not force and is_fresh(prd_file, features_file):
+            prd_result = prd_file
+            print_step_info("Up to date, reusing the previous run's output")
+        else:
+            prd_result = generate_prd_from_file(features_file, prd_file)
+        if not prd_result:
+            print_step_error("Could not generate PRD")
+            return False, None
+        print_step_success(f"Saved: {Colors.DIM}{prd_result}{Colors.RESET}")
 
-    # ═══════════════════════════════════════════════════════════════════════════
-    # Step 5: Check reviewer competence
-    # ═══════════════════════════════════════════════════════════════════════════
-    print_step_header(5, total_steps, f"{SYMBOLS['star']} Checking reviewer competence")
-    reviewer_result, best_reviewer = check_reviewers_for_issue(
-        comments_file, repo, output_dir, wait=False
-    )
-    if not reviewer_result:
-        print_step_error("Could not check reviewers")
-        return False, None
-    print_step_success(f"Saved: {Colors.DIM}{reviewer_result}{Colors.RESET}")
-    if best_reviewer:
-        print_sub_step("Best reviewer", f"{Colors.BRIGHT_CYAN}@{best_reviewer}{Colors.RESET}")
+        # ═══════════════════════════════════════════════════════════════════════
+        # Step 4: Generate bug fix
+        # ═══════════════════════════════════════════════════════════════════════
+        print_step_header(4, total_steps, f"{SYMBOLS['bug']} Generating bug fix")
+        bug_fix_result = output_dir / "bug_fix.patch"
+        # Steps 6-8 read bug_fix.json as well, so both outputs must be current
+        if not force and all(is_fresh(out, prd_file, features_file)
+                             for out in (bug_fix_result, output_dir / "bug_fix.json")):
+            print_step_info("Up to date, reusing the previous run's output")
+        else:
+            bug_fix_result = generate_fix(prd_file, features_file, output_dir, api_key)
+        if not bug_fix_result:
+            print_step_error("Could not generate bug fix")
+            return False, None
+        print_step_success(f"Saved: {Colors.DIM}{bug_fix_result}{Colors.RESET}")
+
+        # ═══════════════════════════════════════════════════════════════════════
+        # Step 5: Check reviewer competence
+        # ═══════════════════════════════════════════════════════════════════════
+        print_step_header(5, total_steps, f"{SYMBOLS['star']} Checking reviewer competence")
+        if reviewer_check is None:
+            print_step_info("Up to date, reusing the previous run's output")
+            with open(reviewer_file, 'r') as f:
+                reviewer_result, best_reviewer = reviewer_file, json.load(f).get("best_reviewer")
+        else:
+            reviewer_result, best_reviewer = reviewer_check.result()
+        if not reviewer_result:
+            print_step_error("Could not check reviewers")
+            return False, None
+        print_step_success(f"Saved: {Colors.DIM}{reviewer_result}{Colors.RESET}")
+        if best_reviewer:
+            print_sub_step("Best reviewer", f"{Colors.BRIGHT_CYAN}@{best_reviewer}{Colors.RESET}")
+    finally:
+        # A failed run must not leave the check writing reviewer.json
+        # behind it, so one that has already started is waited out
+        if reviewer_check is not None and not reviewer_check.cancel():
+            wait((reviewer_check,))
 
     # ═══════════════════════════════════════════════════════════════════════════
     # Step 6: Prepare initial patch folder
     # ═══════════════════════════════════════════════════════════════════════════
     print_step_header(6, total_steps, f"{SYMBOLS['folder']} Preparing initial patch folder")
     analysis_file = output_dir / "prd.analysis.json"
+    # Steps 3 and 4 are done writing, so each optional artifact is checked once
+    # here and the answer reused by step 7
+    if not analysis_file.exists():
+        analysis_file = None
     bug_fix_json = output_dir / "bug_fix.json"
+    if not bug_fix_json.exists():
+        bug_fix_json = None
 
     patch_folder = prepare_patch_folder(
         output_dir,
@@ -297,8 +347,8 @@ def run_bugout(
         reviewer_result,
         comments_file,
         features_file,
-        analysis_file if analysis_file.exists() else None,
-        bug_fix_json if bug_fix_json.exists() else None,
+        analysis_file,
+        bug_fix_json,
         run_id
     )
     print_step_success(f"Created: {Colors.DIM}{patch_folder}{Colors.RESET}")
@@ -307,10 +357,9 @@ def run_bugout(
     # Step 7: Clone repo and run agentic loop
     # ═══════════════════════════════════════════════════════════════════════════
     print_step_header(7, total_steps, f"{SYMBOLS['rocket']} Running agentic loop with OpenAI")
-    bug_fix_json_path = output_dir / "bug_fix.json"
     clone_path, agent_response = run_agentic_loop(
         repo, prd_file,
-        bug_fix_json_path if bug_fix_json_path.exists() else bug_fix_result,
+        bug_fix_json or bug_fix_result,
         output_dir
     )
     if not clone_path or not agent_response:
@@ -386,6 +435,7 @@ def main():
 Examples:
   python bugout.py microsoft/vscode 12345
   python bugout.py facebook/react 67890 ./my_output
+  python bugout.py facebook/react 67890 ./my_output --force
   python bugout.py --gui
         """
     )
@@ -394,6 +444,7 @@ Examples:
     parser.add_argument("issue", nargs="?", help="Issue number")
     parser.add_argument("output_dir", nargs="?", help="Output directory (default: ./bugout_data/<uuid>)")
     parser.add_argument("--gui", action="store_true", help="Launch graphical user interface")
+    parser.add_argument("--force", action="store_true", help="Rerun every step even if output_dir holds up-to-date results")
     
     args = parser.parse_args()
     
@@ -411,12 +462,7 @@ Examples:
     
     # Validate CLI arguments
     if not args.repo or not args.issue:
-        # Load logo for usage message
-        logo_path = Path(__file__).parent.parent / "logo.ansiart"
-        logo = ""
-        if logo_path.exists():
-            with open(logo_path, 'r') as f:
-                logo = f.read()
+        logo = load_logo()
 
         print(f"""
 {Colors.BRIGHT_CYAN}{logo}{Colors.RESET}
@@ -443,7 +489,7 @@ Examples:
         sys.exit(1)
 
     # Run BugOut
-    success, patch_folder = run_bugout(repo, issue_number, output_dir)
+    success, patch_folder = run_bugout(repo, issue_number, output_dir, args.force)
 
     if not success:
         print(f"\n{Colors.BG_RED}{Colors.BOLD} BugOut Failed {Colors.RESET}", file=sys.stderr)
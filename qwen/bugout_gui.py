@@ -14,6 +14,7 @@ import os
 import sys
 import io
 import re
+import shutil
 from pathlib import Path
 from datetime import datetime
 from dotenv import load_dotenv
@@ -33,6 +34,9 @@ SYMBOLS = {
     "sparkle": "✨",
 }
 
+# SGR color/style sequences emitted by the pipeline's Colors helpers
+ANSI_ESCAPE = re.compile(r'\033\[[0-9;]*m')
+
 
 class LogPanel(wx.Panel):
     """Panel for displaying log output with syntax highlighting."""
@@ -92,18 +96,24 @@ class LogPanel(wx.Panel):
     
     def _parse_and_log(self, text):
         """Parse ANSI codes and log with appropriate style."""
-        # Strip ANSI codes
-        clean_text = re.sub(r'\033\[[0-9;]*m', '', text)
+        # Strip ANSI codes; most lines carry none, and the ESC check is cheap
+        if '\033' in text:
+            clean_text = ANSI_ESCAPE.sub('', text)
+        else:
+            clean_text = text
         
         if not clean_text.strip():
             return
         
-        # Determine style based on content
-        if '✓' in text or 'complete' in text.lower():
+        # Determine style based on content; a success marker settles it
+        # before the line is lowercased, and it's lowercased only once
+        if '✓' in text:
             attr = self.attr_success
-        elif '✗' in text or 'error' in text.lower() or 'failed' in text.lower():
+        elif 'complete' in (lower := text.lower()):
+            attr = self.attr_success
+        elif '✗' in text or 'error' in lower or 'failed' in lower:
             attr = self.attr_error
-        elif '⚠' in text or 'warning' in text.lower():
+        elif '⚠' in text or 'warning' in lower:
             attr = self.attr_warning
         elif '●' in text or '━' in text:
             attr = self.attr_bold
@@ -534,13 +544,10 @@ class BugOutFrame(wx.Frame):
             )
             return False
         
-        # Check gh CLI
-        import subprocess
-        try:
-            subprocess.run(["gh", "--version"], capture_output=True, check=True)
-        except (subprocess.CalledProcessError, FileNotFoundError):
+        # Check for a GitHub token or the gh CLI on PATH
+        if not (os.environ.get("GH_TOKEN") or os.environ.get("GITHUB_TOKEN") or shutil.which("gh")):
             wx.MessageBox(
-                "GitHub CLI (gh) not found.\n\nPlease install from: https://cli.github.com/",
+                "GitHub CLI (gh) not found and GH_TOKEN not set.\n\nPlease install from: https://cli.github.com/",
                 "Missing Dependency",
                 wx.ICON_ERROR | wx.OK
             )
@@ -1,14 +1,18 @@
 #!/usr/bin/env python3
 """
-comment_fetcher.py - Step 1: Fetch issue comments via gh CLI
+comment_fetcher.py - Step 1: Fetch issue comments from the GitHub REST API
 """
 
 import json
+import os
 import subprocess
 import sys
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional
 
+import requests
+
 # ANSI Colors
 class Colors:
     RESET = "\033[0m"
@@ -22,9 +26,44 @@ class Colors:
 SYMBOLS = {"check": "✅", "arrow": "→", "bug": "🐛"}
 
 
+GITHUB_API = "https://api.github.com"
+
+# One keep-alive session for every GitHub call in this process
+session = requests.Session()
+session.headers.update({"Accept": "application/vnd.github+json"})
+
+
+@lru_cache(maxsize=None)
+def github_token() -> Optional[str]:
+    """Return a token from GH_TOKEN/GITHUB_TOKEN or the gh CLI login, if any."""
+    token = os.environ.get("GH_TOKEN") or os.environ.get("GITHUB_TOKEN")
+    if token:
+        return token
+    try:
+        result = subprocess.run(["gh", "auth", "token"], capture_output=True, text=True)
+        return result.stdout.strip() or None
+    except OSError:
+        return None
+
+
+def github_get(url: str, **params) -> requests.Response:
+    """GET a GitHub API URL, authenticated when a token is available."""
+    token = github_token()
+    headers = {"Authorization": f"Bearer {token}"} if token else {}
+    response = session.get(url, params=params, headers=headers, timeout=30)
+    response.raise_for_status()
+    return response
+
+
+def login(user: Optional[dict]) -> dict:
+    """Map a REST user object to gh's {"login": ...} author shape."""
+    return {"login": (user or {}).get("login", "ghost")}
+
+
 def fetch_issue_comments(repo: str, issue_number: str, output_dir: Path) -> Optional[Path]:
     """
-    Fetch all comments for a GitHub issue using gh CLI.
+    Fetch all comments for a GitHub issue from the REST API.
+    The issue is saved in the same shape `gh issue view --json` produces.
     
     Args:
         repo: Repository in format "owner/repo"
@@ -35,37 +74,50 @@ def fetch_issue_comments(repo: str, issue_number: str, output_dir: Path) -> Opti
         Path to the saved JSON file, or None if failed
     """
     output_file = output_dir / f"issue_{issue_number}_comments.json"
-    
-    # Use gh issue view to get the issue with comments
-    cmd = [
-        "gh", "issue", "view", issue_number,
-        "--repo", repo,
-        "--json", "number,title,body,author,createdAt,comments,labels,state"
-    ]
+    issue_url = f"{GITHUB_API}/repos/{repo}/issues/{issue_number}"
     
     try:
-        result = subprocess.run(
-            cmd,
-            capture_output=True,
-            text=True,
-            check=True
-        )
+        issue = github_get(issue_url).json()
         
-        issue_data = json.loads(result.stdout)
+        # Comments come 100 per page; follow the Link header until the last one
+        comments = []
+        response = github_get(f"{issue_url}/comments", per_page=100)
+        comments.extend(response.json())
+        while "next" in response.links:
+            response = github_get(response.links["next"]["url"])
+            comments.extend(response.json())
+        
+        issue_data = {
+            "number": issue["number"],
+            "title": issue["title"],
+            "body": issue.get("body") or "",
+            "author": login(issue.get("user")),
+            "createdAt": issue["created_at"],
+            "comments": [{
+                "author": login(comment.get("user")),
+                "body": comment.get("body") or "",
+                "createdAt": comment["created_at"],
+            } for comment in comments],
+            "labels": [{"name": label["name"]} for label in issue.get("labels", [])],
+            "state": issue["state"].upper(),
+        }
         
         # Save to file
         output_dir.mkdir(parents=True, exist_ok=True)
-        with open(output_file, 'w') as f:
-            json.dump(issue_data, f, indent=2)
+        # An unchanged issue leaves the file untouched, so its mtime still
+        # marks the later steps' outputs as up to date on a rerun
+        content = json.dumps(issue_data, indent=2)
+        if not output_file.exists() or output_file.read_text() != content:
+            output_file.write_text(content)
 
         num_comments = len(issue_data.get('comments', []))
         print(f"{Colors.BRIGHT_GREEN}{SYMBOLS['check']}{Colors.RESET} {Colors.GREEN}Step 1 complete:{Colors.RESET} Fetched {Colors.BRIGHT_CYAN}{num_comments}{Colors.RESET} comments for issue {Colors.BRIGHT_CYAN}#{issue_number}{Colors.RESET}", file=sys.stderr)
         return output_file
         
-    except subprocess.CalledProcessError as e:
-        print(f"Error fetching issue: {e.stderr}", file=sys.stderr)
+    except requests.RequestException as e:
+        print(f"Error fetching issue: {e}", file=sys.stderr)
         return None
-    except json.JSONDecodeError as e:
+    except (ValueError, KeyError) as e:
         print(f"Error parsing JSON response: {e}", file=sys.stderr)
         return None
 
@@ -4,12 +4,14 @@ feature_extractor.py - Step 2: Feature extraction from bug comments
 """
 
 import json
-import subprocess
+import os
 import sys
 from pathlib import Path
 from typing import List, Dict, Optional
 import uuid
 
+import requests
+
 # ANSI Colors
 class Colors:
     RESET = "\033[0m"
@@ -23,6 +25,50 @@ class Colors:
 SYMBOLS = {"check": "✅", "gear": "⚙️", "arrow": "→"}
 
 
+MODEL_ID = "839c367a-bfa3-4b78-8f3e-85c44f619106"
+SYSTEM_PROMPT = "You are an inference engine that processes text and outputs strict json with the following labels to the dict object: software version, platform, bug behaviour, crash, user frustration, technical description, input data, expected behaviour. You are not conversational."
+BATCH_SYSTEM_PROMPT = SYSTEM_PROMPT + " When given a numbered list of inputs, output a strict json array holding one such dict object per input, in the same order."
+
+# One keep-alive session for every FastINO call in this process; bug_fixer
+# reuses it for step 4, so the TLS connection from step 2 carries over
+session = requests.Session()
+
+# Texts packed into a single inference request. The model is tuned for one
+# object per call, so this stays at 1 unless FASTINO_BATCH_SIZE asks for more.
+BATCH_SIZE = max(1, int(os.environ.get("FASTINO_BATCH_SIZE", "1")))
+
+
+def infer(system_prompt: str, content: str, max_tokens: int, api_key: str):
+    """Send one prompt to the FastINO API and return the parsed completion."""
+    response = session.post(
+        "https://api.pioneer.ai/inference",
+        headers={
+            "Content-Type": "application/json",
+            "X-API-Key": api_key
+        },
+        json={
+            "model_id": MODEL_ID,
+            "task": "generate",
+            "messages": [
+                {
+                    "role": "system",
+                    "content": system_prompt
+                },
+                {
+                    "role": "user",
+                    "content": content
+                }
+            ],
+            "temperature": 0,
+            "max_tokens": max_tokens
+        }
+    )
+    
+    obj = response.json()
+    completion = obj.get('completion', '{}')
+    return json.loads(completion)
+
+
 def extract_features_from_text(text: str, api_key: str) -> Optional[Dict]:
     """
     Extract features from a single text using the FastINO API.
@@ -34,42 +80,30 @@ def extract_features_from_text(text: str, api_key: str) -> Optional[Dict]:
     Returns:
         Dict with extracted features or None if failed
     """
-    import requests
-    
     try:
-        response = requests.post(
-            "https://api.pioneer.ai/inference",
-            headers={
-                "Content-Type": "application/json",
-                "X-API-Key": api_key
-            },
-            json={
-                "model_id": "839c367a-bfa3-4b78-8f3e-85c44f619106",
-                "task": "generate",
-                "messages": [
-                    {
-                        "role": "system",
-                        "content": "You are an inference engine that processes text and outputs strict json with the following labels to the dict object: software version, platform, bug behaviour, crash, user frustration, technical description, input data, expected behaviour. You are not conversational."
-                    },
-                    {
-                        "role": "user",
-                        "content": text
-                    }
-                ],
-                "temperature": 0,
-                "max_tokens": 256
-            }
-        )
-        
-        obj = response.json()
-        completion = obj.get('completion', '{}')
-        features = json.loads(completion)
-        return features
+        return infer(SYSTEM_PROMPT, text, 256, api_key)
     except Exception as e:
         print(f"Error extracting features: {e}", file=sys.stderr)
         return None
 
 
+def extract_features_from_batch(texts: List[str], api_key: str) -> List[Optional[Dict]]:
+    """
+    Extract features for several texts with one request, falling back to
+    one request per text if the answer doesn't line up with the inputs.
+    """
+    if len(texts) > 1:
+        content = f"Process the following {len(texts)} inputs and return a JSON array of objects in order:\n"
+        content += "\n".join(f"{i}. {json.dumps(text)}" for i, text in enumerate(texts, 1))
+        try:
+            results = infer(BATCH_SYSTEM_PROMPT, content, 256 * len(texts), api_key)
+        except Exception:
+            results = None
+        if isinstance(results, list) and len(results) == len(texts) and all(isinstance(r, dict) for r in results):
+            return results
+    return [extract_features_from_text(text, api_key) for text in texts]
+
+
 def process_comments(comments_file: Path, api_key: str, output_file: Path) -> Optional[Path]:
     """
     Process all comments from an issue and extract features.
@@ -110,14 +144,15 @@ def process_comments(comments_file: Path, api_key: str, output_file: Path) -> Op
     
     print(f"{Colors.BRIGHT_CYAN}{SYMBOLS['gear']}{Colors.RESET} {Colors.CYAN}Processing {len(texts_to_process)} text entries...{Colors.RESET}", file=sys.stderr)
 
-    # Extract features for each text
+    # Extract features, BATCH_SIZE texts per request
     bugs_with_features = []
-    for i, item in enumerate(texts_to_process):
-        print(f"  {Colors.DIM}{SYMBOLS['arrow']}{Colors.RESET} {Colors.DIM}Processing {i+1}/{len(texts_to_process)}...{Colors.RESET}", file=sys.stderr)
-        
-        features = extract_features_from_text(item['text'], api_key)
+    for start in range(0, len(texts_to_process), BATCH_SIZE):
+        batch = texts_to_process[start:start + BATCH_SIZE]
+        print(f"  {Colors.DIM}{SYMBOLS['arrow']}{Colors.RESET} {Colors.DIM}Processing {start + len(batch)}/{len(texts_to_process)}...{Colors.RESET}", file=sys.stderr)
         
-        if features:
+        for item, features in zip(batch, extract_features_from_batch([item['text'] for item in batch], api_key)):
+            if not features:
+                continue
             entry = {
                 "uuid": str(uuid.uuid4()),
                 "source": item['source'],
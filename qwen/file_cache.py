@@ -0,0 +1,47 @@
+#!/usr/bin/env python3
+"""
+file_cache.py - On-disk JSON cache shared by the qwen steps
+"""
+
+import hashlib
+import json
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Any, Optional
+from dotenv import load_dotenv
+
+load_dotenv(dotenv_path=Path(__file__).parent.parent / ".env")
+
+CACHE_DIR = Path(os.environ.get("BUGOUT_CACHE_DIR", ".bugout_cache"))
+
+
+def cache_key(*parts: Any) -> str:
+    """Return a SHA-256 hex digest identifying the given JSON-serializable parts."""
+    return hashlib.sha256(json.dumps(parts, sort_keys=True).encode()).hexdigest()
+
+
+def cache_get(namespace: str, key: str, max_age: Optional[float] = None) -> Optional[Any]:
+    """
+    Return the cached value for key, or None on a miss.
+    Entries older than max_age seconds count as misses.
+    """
+    path = CACHE_DIR / namespace / f"{key}.json"
+    try:
+        if max_age is not None and time.time() - path.stat().st_mtime > max_age:
+            return None
+        with open(path) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def cache_put(namespace: str, key: str, value: Any) -> None:
+    """Store value under key, replacing any previous entry atomically."""
+    path = CACHE_DIR / namespace / f"{key}.json"
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    with open(tmp, "w") as f:
+        json.dump(value, f)
+    os.replace(tmp, path)
@@ -5,12 +5,26 @@ Creates a complete patch folder with reviewer.json, patch, PRD, and all relevant
 """
 
 import json
+import os
 import shutil
 import sys
 from pathlib import Path
 from typing import Optional, Dict
 
 
+def _place(src: Path, dest: Path):
+    """Hardlink src to dest, falling back to a real copy across filesystems."""
+    # A re-run may find dest already linked to src; otherwise drop the stale copy
+    if dest.exists():
+        if os.path.samefile(src, dest):
+            return
+        dest.unlink()
+    try:
+        os.link(src, dest)
+    except OSError:
+        shutil.copy2(src, dest)
+
+
 def prepare_patch_folder(
     output_dir: Path,
     prd_file: Path,
@@ -59,7 +73,7 @@ def prepare_patch_folder(
     for src, dest_name in artifacts:
         if src and src.exists():
             dest = patch_folder / dest_name
-            shutil.copy2(src, dest)
+            _place(src, dest)
     
     # Create patch_manifest.json
     manifest = {
@@ -23,10 +23,9 @@ class Colors:
 SYMBOLS = {"check": "✅", "target": "🎯", "file": "📄"}
 
 
-def compute_frequency(values: list) -> List[List]:
+def compute_frequency(counter: Counter) -> List[List]:
     """Return [[value, count], ...] sorted by count descending."""
-    counter = Counter(str(v) for v in values if v)
-    return [[v, c] for v, c in counter.most_common()]
+    return list(map(list, counter.most_common()))
 
 
 def analyze_bug_reports(issue_id: str, reports: List[Dict]) -> Dict:
@@ -54,39 +53,46 @@ def analyze_bug_reports(issue_id: str, reports: List[Dict]) -> Dict:
         "expected_behaviour",
     ]
     
-    frequency_dist: Dict[str, List] = {}
+    # Gather everything in one walk over the reports. Text entries are
+    # deduped in first-seen order using dict keys.
+    counters = {field: Counter() for field in CATEGORICAL_FIELDS}
+    texts: Dict[str, Dict[str, None]] = {field: {} for field in TEXT_FIELDS}
+    crashes = 0
+    crash_reports = 0
     
-    for field in CATEGORICAL_FIELDS:
-        values = [r.get(field) for r in reports if field in r]
-        frequency_dist[field] = compute_frequency(values)
+    for r in reports:
+        for field in CATEGORICAL_FIELDS:
+            v = r.get(field)
+            if v:
+                counters[field][str(v)] += 1
+        for field in TEXT_FIELDS:
+            v = r.get(field)
+            if isinstance(v, str) and v.strip():
+                texts[field][v.strip()] = None
+        crash = r.get("crash", False)
+        if isinstance(crash, bool):
+            crash_reports += 1
+            crashes += crash
     
-    # Collect unique text entries
-    text_aggregates: Dict[str, List[str]] = {}
-    for field in TEXT_FIELDS:
-        seen = []
-        for r in reports:
-            v = r.get(field, "").strip() if isinstance(r.get(field), str) else ""
-            if v and v not in seen:
-                seen.append(v)
-        text_aggregates[field] = seen
+    frequency_dist: Dict[str, List] = {field: compute_frequency(counters[field]) for field in CATEGORICAL_FIELDS}
+    text_aggregates: Dict[str, List[str]] = {field: list(texts[field]) for field in TEXT_FIELDS}
     
     # Derive crash rate
-    crash_flags = [r.get("crash", False) for r in reports]
-    crash_bools = [c for c in crash_flags if isinstance(c, bool)]
-    crash_rate = round(sum(1 for c in crash_bools if c) / len(crash_bools) * 100, 1) if crash_bools else 0
+    crash_rate = round(crashes / crash_reports * 100, 1) if crash_reports else 0
     
-    # Most common frustration level
-    frustration_dist = dict(frequency_dist.get("user_frustration", []))
-    top_frustration = max(frustration_dist, key=frustration_dist.get) if frustration_dist else "unknown"
+    # Distributions are sorted most common first, so the head is the top value
+    def top(field: str) -> str:
+        dist = frequency_dist[field]
+        return dist[0][0] if dist else "unknown"
     
     prd_summary = {
         "issue_id": issue_id,
         "total_reports": len(reports),
         "crash_rate_pct": crash_rate,
-        "dominant_frustration_level": top_frustration,
-        "top_affected_platform": frequency_dist["platform"][0][0] if frequency_dist.get("platform") else "unknown",
-        "top_affected_version": frequency_dist["software_version"][0][0] if frequency_dist.get("software_version") else "unknown",
-        "primary_bug_behaviour": frequency_dist["bug_behaviour"][0][0] if frequency_dist.get("bug_behaviour") else "unknown",
+        "dominant_frustration_level": top("user_frustration"),
+        "top_affected_platform": top("platform"),
+        "top_affected_version": top("software_version"),
+        "primary_bug_behaviour": top("bug_behaviour"),
     }
     
     return {
@@ -9,6 +9,7 @@ import subprocess
 import sys
 import tempfile
 import shutil
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional, Dict, List, Tuple
 from dotenv import load_dotenv
@@ -67,6 +68,28 @@ def clone_repository(repo: str, temp_dir: Path) -> Path:
         return None
 
 
+STRUCTURE_EXTENSIONS = [".py", ".js", ".ts", ".tsx", ".rs", ".go", ".java", ".c", ".cpp", ".h", ".hpp"]
+RELEVANT_EXTENSIONS = [".py", ".js", ".ts", ".tsx", ".rs", ".go"]
+
+# Vendored, generated and VCS directories that never hold the bug
+SKIP_DIRS = {".git", "node_modules", "__pycache__", "dist", "build"}
+
+
+def files_by_extension(repo_path: Path, extensions: List[str]) -> Dict[str, List[str]]:
+    """
+    Walk the repository once and group file paths by extension, in sorted
+    order. This replaces a find subprocess per extension.
+    """
+    found = {ext: [] for ext in extensions}
+    for root, dirs, names in os.walk(repo_path):
+        dirs[:] = sorted(d for d in dirs if d not in SKIP_DIRS)
+        for name in sorted(names):
+            paths = found.get(os.path.splitext(name)[1])
+            if paths is not None:
+                paths.append(os.path.join(root, name))
+    return found
+
+
 def get_repo_structure(repo_path: Path, max_files: int = 100) -> str:
     """
     Get a summary of the repository structure.
@@ -84,20 +107,9 @@ def get_repo_structure(repo_path: Path, max_files: int = 100) -> str:
     file_types = {}
     all_files = []
     
-    for ext in ["*.py", "*.js", "*.ts", "*.tsx", "*.rs", "*.go", "*.java", "*.c", "*.cpp", "*.h", "*.hpp"]:
-        try:
-            result = subprocess.run(
-                ["find", str(repo_path), "-name", ext, "-type", "f"],
-                capture_output=True,
-                text=True,
-                timeout=30
-            )
-            files = [f for f in result.stdout.strip().split('\n') if f]
-            for f in files[:20]:
-                all_files.append(f)
-            file_types[ext] = len(files)
-        except Exception:
-            pass
+    for ext, files in files_by_extension(repo_path, STRUCTURE_EXTENSIONS).items():
+        all_files.extend(files[:20])
+        file_types[f"*{ext}"] = len(files)
     
     structure.append("File counts by type:")
     for ext, count in file_types.items():
@@ -111,6 +123,18 @@ def get_repo_structure(repo_path: Path, max_files: int = 100) -> str:
     return "\n".join(structure)
 
 
+@lru_cache(maxsize=8)
+def _read_text(path: str, mtime_ns: int) -> str:
+    """Contents of path; mtime_ns is part of the key so an edited file is read again."""
+    with open(path, 'r') as f:
+        return f.read()
+
+
+def read_prd(prd_file: Path) -> str:
+    """Read the PRD, once per version of the file."""
+    return _read_text(str(prd_file), prd_file.stat().st_mtime_ns)
+
+
 def read_relevant_files(repo_path: Path, prd_file: Path) -> List[Dict]:
     """
     Read files that might be relevant to the bug based on PRD analysis.
@@ -123,8 +147,7 @@ def read_relevant_files(repo_path: Path, prd_file: Path) -> List[Dict]:
         List of dicts with file path and content
     """
     # Parse PRD for keywords
-    with open(prd_file, 'r') as f:
-        prd = f.read().lower()
+    prd = read_prd(prd_file).lower()
     
     # Extract potential file patterns from PRD
     keywords = []
@@ -138,33 +161,24 @@ def read_relevant_files(repo_path: Path, prd_file: Path) -> List[Dict]:
     
     relevant_files = []
     
-    # Search for relevant files
-    for ext in ["*.py", "*.js", "*.ts", "*.tsx", "*.rs", "*.go"]:
-        try:
-            result = subprocess.run(
-                ["find", str(repo_path), "-name", ext, "-type", "f"],
-                capture_output=True,
-                text=True,
-                timeout=30
-            )
-            files = [f for f in result.stdout.strip().split('\n') if f]
-            
-            for filepath in files[:50]:  # Limit files to read
-                try:
-                    with open(filepath, 'r', encoding='utf-8', errors='ignore') as f:
-                        content = f.read()
-                    
-                    # Only include files with meaningful content
-                    if len(content) > 100 and len(content) < 50000:
-                        rel_path = str(filepath).replace(str(repo_path), "")
-                        relevant_files.append({
-                            "path": rel_path,
-                            "content": content[:10000]  # Truncate for context
-                        })
-                except Exception:
-                    pass
-        except Exception:
-            pass
+    # Search for relevant files, stopping once enough have been read
+    for files in files_by_extension(repo_path, RELEVANT_EXTENSIONS).values():
+        for filepath in files[:50]:  # Limit files to read
+            if len(relevant_files) >= 20:
+                break
+            try:
+                with open(filepath, 'r', encoding='utf-8', errors='ignore') as f:
+                    content = f.read()
+                
+                # Only include files with meaningful content
+                if len(content) > 100 and len(content) < 50000:
+                    rel_path = str(filepath).replace(str(repo_path), "")
+                    relevant_files.append({
+                        "path": rel_path,
+                        "content": content[:10000]  # Truncate for context
+                    })
+            except Exception:
+                pass
     
     return relevant_files[:20]  # Limit to 20 files
 
@@ -187,8 +201,7 @@ def create_agentic_prompt(
     Returns:
         Prompt string for the AI agent
     """
-    with open(prd_file, 'r') as f:
-        prd = f.read()
+    prd = read_prd(prd_file)
     
     # Try to load bug fix JSON, fallback to patch
     bug_context = ""
@@ -6,12 +6,15 @@ reviewer_checker_wrapper.py - Step 5: Check reviewer competence using Yutori API
 import json
 import sys
 import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Dict, List, Optional
 import requests
 from dotenv import load_dotenv
 import os
 
+from file_cache import cache_key, cache_get, cache_put
+
 load_dotenv(dotenv_path=Path(__file__).parent.parent / ".env")
 
 # ANSI Colors
@@ -32,6 +35,17 @@ SYMBOLS = {"check": "✅", "star": "★", "user": "👤"}
 YUTORI_API_KEY = os.environ.get("YUTORI_KEY")
 YUTORI_BASE_URL = "https://api.yutori.com/v1"
 
+# Upper bound on scouts being created at the same time
+MAX_CONCURRENT_CHECKS = 8
+
+# Scout calls share one keep-alive session, with a connection per concurrent check
+session = requests.Session()
+session.mount("https://", requests.adapters.HTTPAdapter(pool_maxsize=MAX_CONCURRENT_CHECKS))
+
+# Successful checks are reused for the same (repo, user) for this long
+REVIEWER_CACHE_NAMESPACE = "qwen_reviewers"
+REVIEWER_CACHE_TTL = 24 * 3600
+
 
 def create_scout_for_user(github_username: str, repo: str) -> Optional[Dict]:
     """
@@ -64,7 +78,7 @@ def create_scout_for_user(github_username: str, repo: str) -> Optional[Dict]:
     }
 
     try:
-        response = requests.post(
+        response = session.post(
             f"{YUTORI_BASE_URL}/scouting/tasks",
             headers=headers,
             json=payload
@@ -84,7 +98,7 @@ def get_scout_status(scout_id: str) -> Optional[Dict]:
     headers = {"X-API-Key": YUTORI_API_KEY}
 
     try:
-        response = requests.get(
+        response = session.get(
             f"{YUTORI_BASE_URL}/scouting/tasks/{scout_id}",
             headers=headers
         )
@@ -103,7 +117,7 @@ def get_scout_results(scout_id: str) -> Optional[Dict]:
     headers = {"X-API-Key": YUTORI_API_KEY}
 
     try:
-        response = requests.get(
+        response = session.get(
             f"{YUTORI_BASE_URL}/scouting/tasks/{scout_id}/results",
             headers=headers
         )
@@ -204,15 +218,33 @@ def extract_commenters_from_issue(comments_file: Path) -> List[str]:
     return sorted(list(usernames))
 
 
+def load_cached_check(github_username: str, repo: str, wait: bool) -> Optional[Dict]:
+    """Return a cached check younger than REVIEWER_CACHE_TTL, or None."""
+    return cache_get(REVIEWER_CACHE_NAMESPACE, cache_key(repo, github_username, wait), REVIEWER_CACHE_TTL)
+
+
+def save_cached_check(github_username: str, repo: str, wait: bool, result: Dict):
+    """Store a check result, replacing any earlier one."""
+    cache_put(REVIEWER_CACHE_NAMESPACE, cache_key(repo, github_username, wait), result)
+
+
 def check_reviewers_bulk(usernames: List[str], repo: str, wait: bool = False) -> List[Dict]:
     """
     Check competence for multiple reviewers.
+    Checks from the last REVIEWER_CACHE_TTL seconds are reused and the rest
+    run concurrently; results keep the order of usernames.
     """
-    results = []
-    for username in usernames:
-        result = check_reviewer_competence(username, repo, wait)
-        results.append(result)
-    return results
+    results = {username: load_cached_check(username, repo, wait) for username in usernames}
+    misses = [username for username, result in results.items() if result is None]
+    
+    with ThreadPoolExecutor(max_workers=MAX_CONCURRENT_CHECKS) as pool:
+        for username, result in zip(misses, pool.map(lambda username: check_reviewer_competence(username, repo, wait), misses)):
+            # Failed checks are not cached so the next run tries again
+            if result.get("scout_id"):
+                save_cached_check(username, repo, wait, result)
+            results[username] = result
+    
+    return [results[username] for username in usernames]
 
 
 def get_best_reviewer(results: List[Dict]) -> Optional[str]:
@@ -7,14 +7,43 @@ import os
 import sys
 import json
 import requests
+from urllib3.util.retry import Retry
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, List, Optional
 from dotenv import load_dotenv
 
+from cache import cache_key, cache_get, cache_put
+
 load_dotenv()
 
 YUTORI_API_KEY = os.environ.get("YUTORI_API_KEY")
 YUTORI_BASE_URL = "https://api.yutori.com/v1"
 
+# Upper bound on scouts being created at the same time
+MAX_CONCURRENT_CHECKS = 8
+
+# How long a reviewer check result is reused for the same (repo, user)
+REVIEWER_CACHE_TTL = 7 * 24 * 3600
+
+# Shared keep-alive session for the Yutori status and result lookups. These
+# are GETs, so they are retried on gateway errors too; rate-limited calls wait
+# out the Retry-After header before retrying, instead of failing the check.
+RETRY = Retry(total=4, backoff_factor=1, status_forcelist=(429, 502, 503, 504))
+session = requests.Session()
+session.mount("https://", requests.adapters.HTTPAdapter(pool_maxsize=MAX_CONCURRENT_CHECKS, max_retries=RETRY))
+
+# Creating a scout is a POST that bills a new scout each time it lands, so it
+# is only retried when Yutori refused it outright with a 429. A gateway error
+# or a dropped read may come after the scout was made, so those are not retried.
+class CreateRetry(Retry):
+    """Retry policy that honours Retry-After on a 429 only, not on a 503."""
+    RETRY_AFTER_STATUS_CODES = frozenset({429})
+
+
+CREATE_RETRY = CreateRetry(total=4, read=0, other=0, backoff_factor=1, status_forcelist=(429,), allowed_methods=frozenset({"POST"}))
+create_session = requests.Session()
+create_session.mount("https://", requests.adapters.HTTPAdapter(pool_maxsize=MAX_CONCURRENT_CHECKS, max_retries=CREATE_RETRY))
+
 
 def create_scout_for_user(github_username: str, repo: str) -> Optional[Dict]:
     """
@@ -49,7 +78,7 @@ def create_scout_for_user(github_username: str, repo: str) -> Optional[Dict]:
     }
     
     try:
-        response = requests.post(
+        response = create_session.post(
             f"{YUTORI_BASE_URL}/scouting/tasks",
             headers=headers,
             json=payload
@@ -73,7 +102,7 @@ def get_scout_status(scout_id: str) -> Optional[Dict]:
     }
     
     try:
-        response = requests.get(
+        response = session.get(
             f"{YUTORI_BASE_URL}/scouting/tasks/{scout_id}",
             headers=headers
         )
@@ -96,7 +125,7 @@ def get_scout_results(scout_id: str) -> Optional[Dict]:
     }
     
     try:
-        response = requests.get(
+        response = session.get(
             f"{YUTORI_BASE_URL}/scouting/tasks/{scout_id}/results",
             headers=headers
         )
@@ -140,12 +169,23 @@ def check_reviewer_competence(github_username: str, repo: str) -> Dict:
 def check_reviewers_bulk(usernames: List[str], repo: str) -> List[Dict]:
     """
     Check competence for multiple reviewers.
+    Duplicate usernames are checked once, and results cached within the last
+    REVIEWER_CACHE_TTL seconds are reused. The remaining checks run concurrently.
+    Results keep the order of usernames.
     """
-    results = []
-    for username in usernames:
-        result = check_reviewer_competence(username, repo)
-        results.append(result)
-    return results
+    usernames = list(dict.fromkeys(usernames))
+    keys = {username: cache_key(repo, username) for username in usernames}
+    results = {username: cache_get("reviewers", keys[username], max_age=REVIEWER_CACHE_TTL) for username in usernames}
+    misses = [username for username, result in results.items() if result is None]
+    
+    with ThreadPoolExecutor(max_workers=MAX_CONCURRENT_CHECKS) as pool:
+        for username, result in zip(misses, pool.map(lambda username: check_reviewer_competence(username, repo), misses)):
+            # Failed checks are not cached so the next run tries again
+            if result.get("scout_id"):
+                cache_put("reviewers", keys[username], result)
+            results[username] = result
+    
+    return [results[username] for username in usernames]
 
 
 def get_best_reviewer(results: List[Dict]) -> Optional[str]: